@@ -1,38 +1,95 @@
 from __future__ import annotations
 import os
 import csv
+import functools
 from typing import TypeVar, Callable, Type, Any
 
+import numpy as np
+
 BASE_PATH = os.path.dirname(__file__)
 
 IntOrFloat = TypeVar("IntOrFloat", int, float)
 
-llf = list[list[float]]
-lli = list[list[int]]
+llf = np.ndarray
+lli = np.ndarray
+
+
+def _parse_csv(
+    filename: str, row_offset: int, column_offset: int, nan: float | int | str,
+    dtype: Type[IntOrFloat],
+) -> np.ndarray:
+    """Parses a resource CSV into a rectangular 2-D array, padding short rows
+    with `nan`."""
+    # Local aliases keep the per-cell work down to one call and one branch.
+    _dt = dtype
+    empty = _dt(nan)
+    rows: list[list[IntOrFloat]] = []
+    with open(f"{BASE_PATH}/resources/{filename}.csv") as file:
+        for current, row in enumerate(csv.reader(file)):
+            if row_offset > current:
+                continue
+            rows.append(
+                [empty if value == "" else _dt(value) for value in row[column_offset:]]
+            )
+    width = max(len(row) for row in rows)
+    values = np.full((len(rows), width), empty, dtype=dtype)
+    for i, row in enumerate(rows):
+        values[i, : len(row)] = row
+    return values
+
+
+def _load_raw(
+    filename: str, row_offset: int, column_offset: int, nan: float | int | str,
+    dtype: Type[IntOrFloat],
+) -> np.ndarray:
+    """
+    Loads the parsed table for a resource CSV, caching it as a read-only
+    memory-mapped `.npy` sidecar so reimports (e.g. in subprocess workers)
+    skip the per-cell parse. Falls back to the in-memory parse when the
+    sidecar cannot be written.
+    """
+    csv_path = f"{BASE_PATH}/resources/{filename}.csv"
+    npy_path = (
+        f"{BASE_PATH}/resources/"
+        f"{filename}.{row_offset}-{column_offset}-{dtype.__name__}.npy"
+    )
+    if os.path.exists(npy_path) and os.path.getmtime(npy_path) >= os.path.getmtime(
+        csv_path
+    ):
+        return np.load(npy_path, mmap_mode="r")
+    values = _parse_csv(filename, row_offset, column_offset, nan, dtype)
+    try:
+        np.save(npy_path, values)
+    except OSError:
+        return values
+    return np.load(npy_path, mmap_mode="r")
 
 
+@functools.lru_cache(maxsize=None)
 def read_csv(
     filename: str,
     value_offset: int = 0,
     row_offset: int = 0,
     column_offset: int = 0,
     nan: float | int | str = 0,
-    conversion: Callable[[IntOrFloat], IntOrFloat] = lambda x: x,
+    conversion: Callable[[Any], Any] = lambda x: x,
     dtype: Type[IntOrFloat] = float,
     fill_value: Any = None,
-) -> list[list[IntOrFloat]]:
-    fill_value = [] if fill_value is None else [fill_value]
-    values = [fill_value for _ in range(value_offset)]
-    with open(f"{BASE_PATH}/resources/{filename}.csv") as file:
-        current = -1
-        for row in csv.reader(file):
-            current += 1
-            if row_offset > current:
-                continue
-            values.append(
-                [
-                    dtype(nan) if value == "" else conversion(dtype(value))
-                    for value in row[column_offset:]
-                ]
-            )
-    return values
+) -> np.ndarray:
+    """
+    Reads a resource CSV file into a contiguous 2-D `np.ndarray`.
+
+    Short rows are padded with `nan` to the width of the longest row and
+    `value_offset` rows filled with `fill_value` (defaults to `nan`) are
+    prepended, so the result is always rectangular. The `conversion` is
+    applied once to the whole array instead of per cell. Parsed tables are
+    cached on disk next to the CSV and repeated identical calls return the
+    same memoized array.
+    """
+    raw = _load_raw(filename, row_offset, column_offset, nan, dtype)
+    fill_value = dtype(nan) if fill_value is None else dtype(fill_value)
+    values = np.full(
+        (value_offset + raw.shape[0], raw.shape[1]), fill_value, dtype=dtype
+    )
+    values[value_offset:] = raw
+    return conversion(values)
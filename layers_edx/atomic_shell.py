@@ -1,9 +1,17 @@
 from __future__ import annotations
 from typing import Protocol, Type
+import numpy as np
 from layers_edx import lli, llf, read_csv
 from layers_edx.element import Element
 from layers_edx.units import ToSI
 
+# Atomic numbers used as database bounds, hoisted out of the per-call
+# lookups (Element("...") performs a linear scan of Element.NAME).
+_Z_LI = Element("Li").atomic_number
+_Z_NE = Element("Ne").atomic_number
+_Z_U = Element("U").atomic_number
+_Z_ES = Element("Es").atomic_number
+
 
 def read_edge_energies(filename: str, offset: int = 0) -> llf:
     return read_csv(filename, value_offset=offset + 1, conversion=ToSI.ev)
@@ -19,27 +27,24 @@ class EdgeEnergy:
 
         @classmethod
         def index(cls, shell: AtomicShell) -> int:
-            if shell.shell <= AtomicShell.from_name("OV"):
+            if shell.shell <= _SHELL_OV:
                 return shell.shell
-            for p_shell in [
-                AtomicShell.from_name(name) for name in ["PI", "PII", "PIII"]
-            ]:
-                if shell.shell == p_shell:
-                    return shell.shell - 4
+            if _SHELL_PI <= shell.shell <= _SHELL_PIII:
+                return shell.shell - 4
             return -1
 
         @classmethod
         def compute(cls, shell: AtomicShell) -> float:
-            if shell.element.atomic_number < Element("Li").atomic_number:
+            if shell.element.atomic_number < _Z_LI:
                 return 0.0
-            if shell.element.atomic_number > Element("U").atomic_number:
+            if shell.element.atomic_number > _Z_U:
                 return 0.0
             i = cls.index(shell)
             if i < 0:
                 return 0.0
-            if i >= len(cls.EDGE_ENERGY[shell.element.atomic_number]):
+            if i >= cls.EDGE_ENERGY.shape[1]:
                 return 0.0
-            return cls.EDGE_ENERGY[shell.element.atomic_number][cls.index(shell)]
+            return cls.EDGE_ENERGY[shell.element.atomic_number, i]
 
     class Williams2011(Database):
         EDGE_ENERGY = read_edge_energies("WilliamsBinding")
@@ -55,11 +60,11 @@ class EdgeEnergy:
 
         @classmethod
         def compute(cls, shell: AtomicShell) -> float:
-            if shell.element.atomic_number < Element("Ne").atomic_number:
+            if shell.element.atomic_number < _Z_NE:
                 return 0.0
-            if shell.element.atomic_number > Element("Fm").atomic_number:
+            if shell.element.atomic_number >= cls.EDGE_ENERGY.shape[0]:
                 return 0.0
-            if shell.shell > AtomicShell.from_name("LIII"):
+            if shell.shell > _SHELL_LIII:
                 return 0.0
             return cls.EDGE_ENERGY[shell.element.atomic_number][shell.shell]
 
@@ -68,22 +73,54 @@ class EdgeEnergy:
 
         @classmethod
         def compute(cls, shell: AtomicShell) -> float:
-            if shell.element.atomic_number < Element("Li").atomic_number:
+            if shell.element.atomic_number < _Z_LI:
                 return 0.0
-            if shell.element.atomic_number > Element("Es").atomic_number:
+            if shell.element.atomic_number > _Z_ES:
                 return 0.0
-            if shell.shell > AtomicShell.from_name("NI"):
+            if shell.shell > _SHELL_NI:
                 return 0.0
             return cls.EDGE_ENERGY[shell.element.atomic_number][shell.shell]
 
+    # The databases in priority order, materialized once instead of per call.
+    _DATABASES: tuple[Type[Database], ...] = (
+        Chantler2005,
+        Williams2011,
+        NIST,
+        DTSA,
+    )
+
+    _TABLE: np.ndarray
+
+    @classmethod
+    def _build_table(cls) -> np.ndarray:
+        """
+        Precomputes a dense (atomic number, shell) -> edge energy table.
+
+        Each database is evaluated once per shell and the first positive value
+        wins, exactly as in the per-call lookup. Shells without a valid value
+        are stored as zero.
+        """
+        table = np.zeros((len(Element.NAME), len(AtomicShell.NAME)))
+        for z in range(1, _Z_ES + 1):
+            element = Element(z)
+            for shell in range(len(AtomicShell.NAME)):
+                atomic_shell = AtomicShell(element, shell)
+                for database in cls._DATABASES:
+                    value = database.compute(atomic_shell)
+                    if value > 0.0:
+                        table[z, shell] = value
+                        break
+        return table
+
     @classmethod
     def compute(cls, shell: AtomicShell) -> float:
         """
         Compute edge energy for a given atomic shell by consulting multiple databases.
 
-        This method attempts to find the edge energy by querying databases in priority
-        order: Chantler2005, Williams2011, NIST, and DTSA. The first database that
-        returns a positive value is used.
+        The databases are queried in priority order: Chantler2005, Williams2011,
+        NIST, and DTSA. The first database that returns a positive value is used.
+        The results are precomputed into a dense lookup table at import time, so
+        repeated calls reduce to a single array access.
 
         :param shell: The atomic shell for which to compute the edge energy
         :type shell: AtomicShell
@@ -91,17 +128,8 @@ class EdgeEnergy:
             database
         :rtype: float
         """
-        databases: list[Type[EdgeEnergy.Database]] = [
-            cls.Chantler2005,
-            cls.Williams2011,
-            cls.NIST,
-            cls.DTSA,
-        ]
-        for database in databases:
-            value = database.compute(shell)
-            if value > 0.0:
-                return value
-        return float("nan")
+        value = cls._TABLE[shell.element.atomic_number, shell.shell]
+        return float(value) if value > 0.0 else float("nan")
 
 
 def read_ground_state_occupancies() -> lli:
@@ -161,7 +189,7 @@ class AtomicShell:
         "QXIII",
     ]
     FAMILY = ["K", "L", "M", "N", "O", "P", "Q"]
-    CAPACITY = [
+    CAPACITY = np.array([
         2,
         2,
         2,
@@ -211,8 +239,8 @@ class AtomicShell:
         12,
         12,
         14,
-    ]
-    ORBITAL_ANGULAR_MOMENTUM = [
+    ])
+    ORBITAL_ANGULAR_MOMENTUM = np.array([
         0,
         0,
         1,
@@ -262,8 +290,8 @@ class AtomicShell:
         5,
         6,
         6,
-    ]
-    TOTAL_ANGULAR_MOMENTUM = [
+    ])
+    TOTAL_ANGULAR_MOMENTUM = np.array([
         0.5,
         0.5,
         0.5,
@@ -313,12 +341,32 @@ class AtomicShell:
         5.5,
         5.5,
         6.5,
-    ]
+    ])
     GROUND_STATE_OCCUPANCY = read_ground_state_occupancies()
 
+    # O(1) replacements for the list.index scans in from_name/family_from_name,
+    # which run inside hot loops whenever shells are constructed by name.
+    _NAME_INDEX = {name: index for index, name in enumerate(NAME)}
+    _FAMILY_INDEX = {family: index for index, family in enumerate(FAMILY)}
+
+    # Precomputed (shell1, shell2) selection-rule masks so the permitted checks
+    # reduce to a single boolean lookup instead of per-call branching. The
+    # half-integer total angular momenta are doubled into int8 fixed point so
+    # the rules evaluate with exact integer arithmetic.
+    _TAM2 = (2 * TOTAL_ANGULAR_MOMENTUM).astype(np.int8)
+    _OAM = ORBITAL_ANGULAR_MOMENTUM.astype(np.int8)
+    _TAM2_DIFF = np.abs(_TAM2[:, None] - _TAM2[None, :])
+    _OAM_DIFF = np.abs(_OAM[:, None] - _OAM[None, :])
+    _DIPOLE_MASK = (_TAM2_DIFF <= 2) & (_OAM_DIFF == 1)
+    _QUADRUPOLE_MASK = (
+        (_TAM2_DIFF <= 4)
+        & ~((_TAM2[:, None] == 1) & (_TAM2[None, :] == 1))
+        & ((_OAM_DIFF | 2) == 2)
+    )
+
     @classmethod
     def from_name(cls, name: str) -> int:
-        return cls.NAME.index(name)
+        return cls._NAME_INDEX[name]
 
     @classmethod
     def get_name(cls, shell: int) -> str:
@@ -326,39 +374,15 @@ class AtomicShell:
 
     @classmethod
     def family_from_name(cls, name: str) -> int:
-        return cls.FAMILY.index(name[0])
+        return cls._FAMILY_INDEX[name[0]]
 
     @classmethod
     def electric_dipole_permitted(cls, shell1: int, shell2: int) -> bool:
-        if (
-            abs(cls.TOTAL_ANGULAR_MOMENTUM[shell1] - cls.TOTAL_ANGULAR_MOMENTUM[shell2])
-            > 1.0
-        ):
-            return False
-        return (
-            abs(
-                cls.ORBITAL_ANGULAR_MOMENTUM[shell1]
-                - cls.ORBITAL_ANGULAR_MOMENTUM[shell2]
-            )
-            == 1
-        )
+        return bool(cls._DIPOLE_MASK[shell1, shell2])
 
     @classmethod
     def electric_quadrupole_permitted(cls, shell1: int, shell2: int) -> bool:
-        if (
-            abs(cls.TOTAL_ANGULAR_MOMENTUM[shell1] - cls.TOTAL_ANGULAR_MOMENTUM[shell2])
-            > 2.0
-        ):
-            return False
-        if (
-            cls.TOTAL_ANGULAR_MOMENTUM[shell1] == 0.5
-            and cls.TOTAL_ANGULAR_MOMENTUM[shell2] == 0.5
-        ):
-            return False
-        delta_l = abs(
-            cls.ORBITAL_ANGULAR_MOMENTUM[shell1] - cls.ORBITAL_ANGULAR_MOMENTUM[shell2]
-        )
-        return delta_l == 0 or delta_l == 2
+        return bool(cls._QUADRUPOLE_MASK[shell1, shell2])
 
     def __init__(self, element: Element, shell: int | str):
         self._element = element
@@ -382,20 +406,20 @@ class AtomicShell:
 
     @property
     def capacity(self) -> int:
-        return self.CAPACITY[self.shell]
+        return int(self.CAPACITY[self.shell])
 
     @property
     def orbital_angular_momentum(self) -> int:
-        return self.ORBITAL_ANGULAR_MOMENTUM[self.shell]
+        return int(self.ORBITAL_ANGULAR_MOMENTUM[self.shell])
 
     @property
     def total_angular_momentum(self) -> float:
-        return self.TOTAL_ANGULAR_MOMENTUM[self.shell]
+        return float(self.TOTAL_ANGULAR_MOMENTUM[self.shell])
 
     @property
     def ground_state_occupancy(self) -> int:
         occ = self.GROUND_STATE_OCCUPANCY[self.element.atomic_number]
-        return occ[self.shell] if len(occ) > self.shell else 0
+        return int(occ[self.shell]) if len(occ) > self.shell else 0
 
     @property
     def principal_quantum_number(self) -> int:
@@ -404,14 +428,8 @@ class AtomicShell:
 
         :return: The principal quantum number for this shell (1-7 for K-Q shells)
         :rtype: int
-        :raises ValueError: If the shell name is invalid
         """
-        n = 1
-        for letter in ["K", "L", "M", "N", "O", "P", "Q"]:
-            if letter in self.name:
-                return n
-            n += 1
-        raise ValueError(f"Invalid shell name: {self.name}")
+        return _PRINCIPAL[self.shell]
 
     @property
     def edge_energy(self) -> float:
@@ -445,3 +463,18 @@ class AtomicShell:
         :rtype: bool
         """
         return self.edge_energy > 0.0
+
+
+# Shell indices used as database bounds in the `EdgeEnergy` lookups, hoisted
+# out of the per-call path (AtomicShell.from_name scans AtomicShell.NAME).
+_SHELL_LIII = AtomicShell.from_name("LIII")
+_SHELL_NI = AtomicShell.from_name("NI")
+_SHELL_OV = AtomicShell.from_name("OV")
+_SHELL_PI = AtomicShell.from_name("PI")
+_SHELL_PIII = AtomicShell.from_name("PIII")
+
+# Principal quantum number per shell index, replacing the substring scan in
+# the `principal_quantum_number` property.
+_PRINCIPAL = [AtomicShell.family_from_name(name) + 1 for name in AtomicShell.NAME]
+
+EdgeEnergy._TABLE = EdgeEnergy._build_table()
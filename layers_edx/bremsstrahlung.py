@@ -1,5 +1,7 @@
 import math
 from abc import ABC, abstractmethod
+import numpy as np
+from scipy.special import erfc
 from layers_edx.element import Composition, Element
 from layers_edx.units import FromSI, ToSI
 from layers_edx.detector.eds_detector import EDSDetector
@@ -33,15 +35,24 @@ class BremsstrahlungAnalytic(ABC):
         :param energy: The photon energy in J.
         """
 
+    def compute_array(self, energies: np.ndarray) -> np.ndarray:
+        """
+        Computes the emitted bremsstrahlung intensity for an array of photon
+        `energies` (J). Subclasses should override this with a vectorized
+        implementation; the fallback evaluates `compute` per energy.
+        """
+        return np.array([self.compute(energy) for energy in energies])
+
     def to_detector(self, detector: EDSDetector, flux: float):
         """
         Compute the bremsstrahlung spectrum as measured by the specified `detector`
         at the specified beam `flux` (nA*s).
         """
         f = detector.calibration.channel_width / 10.0
-        for channel in range(detector.properties.channel_count):
-            energy = ToSI.ev(detector.spectrum.average_energy_from_channel(channel))
-            detector.add_event(energy, max(0.0, self.compute(energy)) * flux * f)
+        channels = np.arange(detector.properties.channel_count)
+        energies = ToSI.ev(detector.spectrum.average_energy_from_channels(channels))
+        intensities = np.maximum(self.compute_array(energies), 0.0) * flux * f
+        detector.add_events(energies, intensities)
 
     def fit_background(
         self,
@@ -79,15 +90,27 @@ class BremsstrahlungAnalytic(ABC):
         for element in composition.elements:
             roi_set.add_xrt_set(XRayTransitionSet(element, e_min, e0))
 
-        tmp: list[tuple[int, int]] = []
-        min_ch = spectrum.channel_from_energy(FromSI.ev(e_min))
-        for roi in roi_set.rois:
-            max_ch = spectrum.channel_from_energy(FromSI.ev(roi.low_energy))
-            if max_ch > min_ch:
-                tmp.append((min_ch, max_ch))
-            min_ch = spectrum.channel_from_energy(FromSI.ev(roi.high_energy))
-        max_ch = spectrum.channel_from_energy(FromSI.ev(e0))
-        tmp.append((min_ch, max_ch))
+        # Candidate background intervals are the gaps between consecutive ROIs,
+        # assembled as a 2-column (start, end) array via vectorized channel
+        # mapping. The trailing interval up to the beam energy is kept
+        # unconditionally, matching the previous sequential construction.
+        roi_lows = np.array([roi.low_energy for roi in roi_set.rois])
+        roi_highs = np.array([roi.high_energy for roi in roi_set.rois])
+        starts = np.concatenate(
+            (
+                [spectrum.channel_from_energy(FromSI.ev(e_min))],
+                spectrum.channels_from_energies(FromSI.ev(roi_highs)),
+            )
+        )
+        ends = np.concatenate(
+            (
+                spectrum.channels_from_energies(FromSI.ev(roi_lows)),
+                [spectrum.channel_from_energy(FromSI.ev(e0))],
+            )
+        )
+        keep = np.ones(starts.shape[0], dtype=bool)
+        keep[:-1] = ends[:-1] > starts[:-1]
+        tmp = np.stack((starts[keep], ends[keep]), axis=1)
 
         intervals: list[tuple[int, int]] = []
         if first_ch < spectrum.channel_count // 10:
@@ -105,12 +128,13 @@ class BremsstrahlungAnalytic(ABC):
             ):
                 break
             best = None
-            for ii in tmp:
-                if ii[1] > min_ch and ii[0] < max_ch:
-                    start = max(ii[0], min_ch)
-                    end = min(ii[1], max_ch)
-                    if best is None or end - start > best[1] - best[0]:
-                        best = (start, end)
+            overlaps = (tmp[:, 1] > min_ch) & (tmp[:, 0] < max_ch)
+            if overlaps.any():
+                clipped_starts = np.maximum(tmp[:, 0], min_ch)
+                clipped_ends = np.minimum(tmp[:, 1], max_ch)
+                lengths = np.where(overlaps, clipped_ends - clipped_starts, -np.inf)
+                longest = int(np.argmax(lengths))
+                best = (int(clipped_starts[longest]), int(clipped_ends[longest]))
             if best is not None:
                 if best[1] - best[0] > width:
                     a = sum(best) // 2
@@ -124,13 +148,13 @@ class Riveros1993:
     @staticmethod
     def elastic_x_sec(z: int, e0k: float) -> float:
         zz = float(z)
-        aa = 3.4e-3 * math.pow(zz, 0.67) / e0k
+        aa = 3.4e-3 * zz**0.67 / e0k
         mc2 = 511.0
         return (
             5.21e-21
             * ((zz / e0k) * (zz / e0k))
             * (4 * math.pi / (aa * (1.0 + aa)))
-            * math.pow(((e0k + mc2) / (e0k + 2.0 * mc2)), 2)
+            * ((e0k + mc2) / (e0k + 2.0 * mc2)) ** 2
         )
 
     @classmethod
@@ -157,78 +181,146 @@ class Riveros1993:
         self.composition = composition
         self.beam_energy = beam_energy
         self.take_off_angle = take_off_angle
-        self.etam = self.compute_etam(composition, FromSI.kev(beam_energy))
+        # Fixed conversions shared by alphaz/betaz/chi on every call.
+        self._e0k = FromSI.kev(beam_energy)
+        self._inv_sin_toa = 1.0 / math.sin(take_off_angle)
+        self._bound_mac = MassAbsorptionCoefficient.bind_composition(composition)
+        self.etam = self.compute_etam(composition, self._e0k)
+        # Per-element constants for the alphaz/betaz sums, hoisted out of the
+        # per-channel compute calls.
+        weight_fractions = composition.weight_fractions
+        self._wf = np.array(list(weight_fractions.values()))
+        self._aw = np.array([e.atomic_weight for e in weight_fractions])
+        self._z_pow_116 = np.array(
+            [e.atomic_number**1.16 for e in weight_fractions]
+        )
+        self._z_pow_15 = np.array([e.atomic_number**1.5 for e in weight_fractions])
+        self._j_kev = np.array(
+            [
+                ToSI.kev(MeanIonizationPotential.Berger83.compute(e))
+                for e in weight_fractions
+            ]
+        )
 
-    def alphaz(self, elm: Element, eck: float) -> float:
-        e0k = FromSI.kev(self.beam_energy)
-        j = ToSI.kev(MeanIonizationPotential.Berger83.compute(elm))
+    def alphaz(self, ek):
+        """Weight-fraction averaged alpha(z) term; `ek` may be a scalar or an
+        array of photon energies (keV) broadcast against the element axis."""
+        e0k = self._e0k
+        ekc = np.asarray(ek)[..., np.newaxis]
         return (
-            (2.14e5 * math.pow(elm.atomic_number, 1.16))
-            / (elm.atomic_weight * math.pow(e0k, 1.25))
-            * math.sqrt(math.log(1.166 * e0k / j) / (e0k - eck))
-        )
+            (2.14e5 * self._z_pow_116)
+            / (self._aw * e0k**1.25)
+            * np.sqrt(np.log(1.166 * e0k / self._j_kev) / (e0k - ekc))
+        ) @ self._wf
 
-    def betaz(self, elm: Element, eck: float) -> float:
-        e0k = FromSI.kev(self.beam_energy)
-        return (1.1e5 * math.pow(elm.atomic_number, 1.5)) / (
-            (e0k - eck) * elm.atomic_weight
-        )
+    def betaz(self, ek):
+        """Weight-fraction averaged beta(z) term; `ek` may be a scalar or an
+        array of photon energies (keV) broadcast against the element axis."""
+        ekc = np.asarray(ek)[..., np.newaxis]
+        return ((1.1e5 * self._z_pow_15) / ((self._e0k - ekc) * self._aw)) @ self._wf
 
     def chi(self, e: float):
-        return MassAbsorptionCoefficient.compute_composition(
-            self.composition, e
-        ) / math.sin(self.take_off_angle)
+        return self._bound_mac(e) * self._inv_sin_toa
 
     def compute(self, e: float) -> float:
         ek = FromSI.kev(e)
         u0 = self.beam_energy / e
-        comp = self.composition
         phi0 = 1.0 + (self.etam * u0 * math.log(u0)) / (u0 - 1.0)
         gamma = (1.0 + self.etam) * (u0 * math.log(u0)) / (u0 - 1.0)
-        alpha = sum([f * self.alphaz(e, ek) for e, f in comp.weight_fractions.items()])
-        beta = sum([f * self.betaz(e, ek) for e, f in comp.weight_fractions.items()])
+        alpha = float(self.alphaz(ek))
+        beta = float(self.betaz(ek))
         xm = FromSI.cm2pg(self.chi(e))
         ff = xm / (2.0 * alpha)
         gg = (beta + xm) / (2.0 * alpha)
         if gg < 22.3:
+            exp_gg2_erfc_gg = math.exp(gg * gg) * (gamma - phi0) * math.erfc(gg)
             fchi = (
                 math.sqrt(math.pi)
                 * (
-                    math.exp(ff * ff) * gamma * alpha * (1.0 - math.erf(ff))
-                    - math.exp(gg * gg) * (gamma - phi0) * alpha * (1.0 - math.erf(gg))
+                    math.exp(ff * ff) * gamma * alpha * math.erfc(ff)
+                    - exp_gg2_erfc_gg * alpha
                 )
             ) / (2.0 * alpha * alpha)
-            f = (
-                math.sqrt(math.pi)
-                * (gamma - math.exp(gg * gg) * (gamma - phi0) * math.erfc(gg))
-            ) / (2.0 * alpha)
+            f = (math.sqrt(math.pi) * (gamma - exp_gg2_erfc_gg)) / (2.0 * alpha)
         else:
             fchi = 0.0
             f = 1.0
         return fchi / f
 
+    def compute_array(self, energies: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of `compute` over an array of photon `energies`
+        (J). The per-element `alphaz`/`betaz` sums are evaluated as a single
+        broadcast over (energies, elements) and the error functions run as
+        SciPy ufuncs instead of per-channel scalar math.
+        """
+        ek = FromSI.kev(energies)
+        u0 = self.beam_energy / energies
+        phi0 = 1.0 + (self.etam * u0 * np.log(u0)) / (u0 - 1.0)
+        gamma = (1.0 + self.etam) * (u0 * np.log(u0)) / (u0 - 1.0)
+        alpha = self.alphaz(ek)
+        beta = self.betaz(ek)
+        xm = FromSI.cm2pg(np.array([self.chi(e) for e in energies]))
+        ff = xm / (2.0 * alpha)
+        gg = (beta + xm) / (2.0 * alpha)
+        result = np.zeros_like(ek)
+        small = gg < 22.3
+        ff, gg = ff[small], gg[small]
+        alpha, phi0, gamma = alpha[small], phi0[small], gamma[small]
+        exp_gg2 = np.exp(gg * gg)
+        fchi = (
+            math.sqrt(math.pi)
+            * (
+                np.exp(ff * ff) * gamma * alpha * erfc(ff)
+                - exp_gg2 * (gamma - phi0) * alpha * erfc(gg)
+            )
+        ) / (2.0 * alpha * alpha)
+        f = (math.sqrt(math.pi) * (gamma - exp_gg2 * (gamma - phi0) * erfc(gg))) / (
+            2.0 * alpha
+        )
+        result[small] = fchi / f
+        return result
+
 
 class Castellano2004aBremsstrahlung(BremsstrahlungAnalytic):
+    def __init__(
+        self, composition: Composition, beam_energy: float, take_off_angle: float
+    ):
+        super().__init__(composition, beam_energy, take_off_angle)
+        # The absorption model (and its per-element precomputation) only
+        # depends on the constructor arguments, so share one instance across
+        # all compute_array calls.
+        self._riveros = Riveros1993(composition, beam_energy, take_off_angle)
+
     def compute(self, energy: float) -> float:
-        result = 0.0
-        ekev = FromSI.kev(energy)
-        if 0.05 < ekev < self.e0_keV:
-            for element, af in self.composition.atomic_fractions.items():
-                z = element.atomic_number
-                result += (
-                    af
-                    * math.sqrt(z)
-                    * (self.e0_keV - ekev)
-                    / ekev
-                    * (
-                        -73.90
-                        - 1.2446 * ekev
-                        + 36.502 * math.log(z)
-                        + (148.5 * math.pow(self.e0_keV, 0.1239) / z)
-                        * (1.0 + (-0.006624 + 0.0002906 * self.e0_keV) * z / ekev)
-                    )
-                )
-            result *= Riveros1993(
-                self.composition, ToSI.kev(self.e0_keV), self.take_off_angle
-            ).compute(energy)
+        return float(self.compute_array(np.array([energy]))[0])
+
+    def compute_array(self, energies: np.ndarray) -> np.ndarray:
+        """
+        Vectorized evaluation of the Castellano (2004) model over an array of
+        photon `energies` (J), broadcasting over (channels, elements).
+        """
+        ekev = FromSI.kev(energies)
+        result = np.zeros_like(ekev)
+        mask = (0.05 < ekev) & (ekev < self.e0_keV)
+        if not mask.any():
+            return result
+        atomic_fractions = self.composition.atomic_fractions
+        z = np.array([element.atomic_number for element in atomic_fractions], float)
+        af = np.array(list(atomic_fractions.values()))
+        ek = ekev[mask][:, np.newaxis]
+        terms = (
+            af
+            * np.sqrt(z)
+            * (self.e0_keV - ek)
+            / ek
+            * (
+                -73.90
+                - 1.2446 * ek
+                + 36.502 * np.log(z)
+                + (148.5 * self.e0_keV**0.1239 / z)
+                * (1.0 + (-0.006624 + 0.0002906 * self.e0_keV) * z / ek)
+            )
+        )
+        result[mask] = terms.sum(axis=1) * self._riveros.compute_array(energies[mask])
         return result
@@ -1,6 +1,7 @@
 import math
 from abc import ABC, abstractmethod
 from typing import Type
+import numpy as np
 from layers_edx.atomic_shell import AtomicShell
 from layers_edx.element import Composition
 from layers_edx.material_properties.fl import Fluorescence
@@ -25,7 +26,13 @@ class Correction(ABC):
         self._properties = properties
         self._beam_energy = ToSI.kev(properties.beam_energy)
         self._take_off_angle = properties.take_off_angle
+        # The take-off angle is fixed, so its sine (and reciprocal, turning the
+        # per-chi division into a multiplication) is evaluated once here.
+        self._sin_toa = math.sin(self._take_off_angle)
+        self._inv_sin_toa = 1.0 / self._sin_toa
         self._mac = MassAbsorptionCoefficient
+        self._bound_mac = MassAbsorptionCoefficient.bind_composition(composition)
+        self._chi_cache: dict[XRayTransition, float] = {}
 
     @property
     def composition(self) -> Composition:
@@ -63,10 +70,14 @@ class Correction(ABC):
     def chi(self, xrt: XRayTransition) -> float:
         """
         Retrieves the mass absorption coefficient for the specified `XRayTransition`.
+        The result is cached per transition since the composition and take-off angle
+        are fixed for the lifetime of the correction.
         """
-        return self.mac.compute_composition(self.composition, xrt.energy) / math.sin(
-            self.take_off_angle
-        )  # TODO: store for xrt
+        chi = self._chi_cache.get(xrt)
+        if chi is None:
+            chi = self._bound_mac(xrt.energy) * self._inv_sin_toa
+            self._chi_cache[xrt] = chi
+        return chi
 
     @abstractmethod
     def compute_za_correction(self, xrt: XRayTransition) -> float:
@@ -98,5 +109,24 @@ class PhiRhoZ(Correction, ABC):
     def compute_curve(self, rho_z: float) -> float:
         """Computes the height of the phi-rho-z at the specified z position."""
 
+    def compute_curve_array(self, rho_z: np.ndarray) -> np.ndarray:
+        """
+        Computes the phi-rho-z curve heights for an array of z positions.
+        Subclasses should override this with a vectorized implementation; the
+        fallback evaluates `compute_curve` per position.
+        """
+        return np.array([self.compute_curve(z) for z in rho_z])
+
     def compute_absorbed(self, rho_z: float, xrt: XRayTransition) -> float:
         return self.compute_curve(rho_z) * math.exp(-self.chi(xrt) * rho_z)
+
+    def compute_absorbed_array(
+        self, rho_z: np.ndarray, xrt: XRayTransition
+    ) -> np.ndarray:
+        """
+        Fused evaluation of `compute_absorbed` over an array of rho-z values.
+        The chi lookup happens once and the curve and absorption factor are
+        combined in a single vectorized expression.
+        """
+        chi = self.chi(xrt)
+        return self.compute_curve_array(rho_z) * np.exp(-chi * rho_z)
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from layers_edx.correction import PhiRhoZ
 from layers_edx.atomic_shell import AtomicShell
 from layers_edx.element import Composition
@@ -32,6 +33,15 @@ class PAP(PhiRhoZ):
     ):
         super().__init__(composition, shell, properties)
 
+        weight_fractions = composition.weight_fractions
+        self._mean_atomic_number = (
+            sum(f * math.sqrt(e.atomic_number) for e, f in weight_fractions.items())
+            ** 2
+        )
+        self._log_mean_atomic_number = math.exp(
+            sum(f * math.log(e.atomic_number) for e, f in weight_fractions.items())
+        )
+
         f = (
             self.bf.compute(composition, shell, self.beam_energy)
             * FromSI.gpcm2kev(self.sp.compute_inv(composition, shell, self.beam_energy))
@@ -49,18 +59,18 @@ class PAP(PhiRhoZ):
         beta = 40.0 / z_bar
         q0 = (
             1.0
-            - (0.535 * math.exp(-math.pow(21.0 / z_bar_n, 1.2)))
-            - (2.5e-4 * math.pow(z_bar_n / 20.0, 3.5))
+            - (0.535 * math.exp(-(21.0 / z_bar_n) ** 1.2))
+            - (2.5e-4 * (z_bar_n / 20.0) ** 3.5)
         )
         q = q0 + ((1.0 - q0) * math.exp((1.0 - u0) / beta))
-        d = 1.0 + (1.0 / math.pow(u0, math.pow(z_bar, 0.45)))
+        d = 1.0 + (1.0 / u0 ** (z_bar**0.45))
 
         rx = q * d * FromSI.gpcm2(self.er.compute(composition, shell, self.beam_energy))
         self.rx = rx
 
-        g1 = 0.11 + (0.41 * math.exp(-math.pow(z_bar / 12.75, 0.75)))
-        g2 = 1.0 - math.exp(-math.pow(u0 - 1.0, 0.35) / 1.19)
-        g3 = 1.0 - math.exp(((0.5 - u0) * math.pow(z_bar, 0.4)) / 4.0)
+        g1 = 0.11 + (0.41 * math.exp(-(z_bar / 12.75) ** 0.75))
+        g2 = 1.0 - math.exp(-(u0 - 1.0) ** 0.35 / 1.19)
+        g3 = 1.0 - math.exp(((0.5 - u0) * z_bar**0.4) / 4.0)
 
         rm = g1 * g2 * g3 * rx
         self.rm = rm
@@ -81,29 +91,15 @@ class PAP(PhiRhoZ):
 
     @property
     def mean_atomic_number(self) -> float:
-        return (
-            sum(
-                [
-                    f * math.sqrt(e.atomic_number)
-                    for e, f in self.composition.weight_fractions.items()
-                ]
-            )
-            ** 2
-        )
+        return self._mean_atomic_number
 
     @property
     def log_mean_atomic_number(self) -> float:
-        return math.exp(
-            sum(
-                [
-                    f * math.log(e.atomic_number)
-                    for e, f in self.composition.weight_fractions.items()
-                ]
-            )
-        )
+        return self._log_mean_atomic_number
 
-    def compute_za_correction(self, xrt: XRayTransition) -> float:
-        chi = FromSI.cm2pg(self.chi(xrt))
+    def _za_from_chi(self, chi: np.ndarray) -> np.ndarray:
+        """Evaluates the generated intensity integral for the given chi values
+        (cm^2/g); shared by the scalar and array entry points."""
         chi2 = chi * chi
         f1 = (self.a1 / chi) * (
             (
@@ -111,7 +107,7 @@ class PAP(PhiRhoZ):
                     ((self.rc - self.rm) * (self.rx - self.rc - (2.0 / chi)))
                     - (2.0 / chi2)
                 )
-                * math.exp(-chi * self.rc)
+                * np.exp(-chi * self.rc)
             )
             - ((self.rc - self.rm) * self.rx)
             + (self.rm * (self.rc - (2.0 / chi)))
@@ -120,17 +116,38 @@ class PAP(PhiRhoZ):
         f2 = (
             (self.a2 / chi)
             * (((self.rx - self.rc) * (self.rx - self.rc - (2.0 / chi))) + (2.0 / chi2))
-            * math.exp(-chi * self.rx)
+            * np.exp(-chi * self.rx)
+        )
+        return f1 + f2
+
+    def compute_za_correction(self, xrt: XRayTransition) -> float:
+        chi = FromSI.cm2pg(self.chi(xrt))
+        return float(ToSI.gpcm2(self._za_from_chi(np.asarray(chi))))
+
+    def compute_za_correction_array(self, energies: np.ndarray) -> np.ndarray:
+        """
+        Computes the ZA correction for an array of photon `energies` (J) in a
+        single vectorized pass.
+        """
+        chi = FromSI.cm2pg(
+            np.array([self._bound_mac(energy) for energy in energies])
+            * self._inv_sin_toa
         )
-        return ToSI.gpcm2(f1 + f2)
+        return ToSI.gpcm2(self._za_from_chi(chi))
 
     def compute_curve(self, rho_z: float) -> float:
-        if rho_z <= 0.0:
-            return 0.0
-        rho_z = FromSI.gpcm2(rho_z)
-        if rho_z < self.rc:
-            b1 = self.phi0 - (self.a1 * self.rm * self.rm)
-            return self.a1 * (rho_z - self.rm) ** 2 + b1
-        elif rho_z < self.rx:
-            return self.a2 * (rho_z - self.rx) ** 2
-        return 0.0
+        return float(self.compute_curve_array(np.asarray(rho_z)))
+
+    def compute_curve_array(self, rho_z: np.ndarray) -> np.ndarray:
+        """Computes the phi-rho-z curve heights for an array of z positions."""
+        rho_z = FromSI.gpcm2(np.asarray(rho_z, dtype=float))
+        b1 = self.phi0 - (self.a1 * self.rm * self.rm)
+        return np.where(
+            rho_z <= 0.0,
+            0.0,
+            np.where(
+                rho_z < self.rc,
+                self.a1 * (rho_z - self.rm) ** 2 + b1,
+                np.where(rho_z < self.rx, self.a2 * (rho_z - self.rx) ** 2, 0.0),
+            ),
+        )
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from layers_edx.correction import PhiRhoZ
 from layers_edx.atomic_shell import AtomicShell
 from layers_edx.element import Composition
@@ -10,6 +11,8 @@ from layers_edx.spectrum.spectrum_properties import SpectrumProperties
 from layers_edx.units import FromSI, ToSI
 from layers_edx.xrt import XRayTransition
 
+_LOG_4 = math.log(4.0)
+
 
 class XPP(PhiRhoZ):
     """
@@ -29,6 +32,15 @@ class XPP(PhiRhoZ):
         properties: SpectrumProperties,
     ):
         super().__init__(composition, shell, properties)
+        # The composition is fixed, so the sqrt-weighted mean atomic number is
+        # reduced once here rather than on every property access.
+        self._mean_atomic_number = (
+            sum(
+                f * math.sqrt(e.atomic_number)
+                for e, f in composition.weight_fractions.items()
+            )
+            ** 2
+        )
         f = (
             self.bf.compute(self.composition, self.shell, self.beam_energy)
             * FromSI.gpcm2kev(
@@ -38,21 +50,19 @@ class XPP(PhiRhoZ):
         )
         phi0 = self.si.compute(self.composition, self.shell, self.beam_energy)
         mean_zb = self.mean_atomic_number
+        log_mzb = math.log(mean_zb)
         u0 = self.beam_energy / self.shell.edge_energy
-        x = 1.0 + (1.3 * math.log(mean_zb))
+        x = 1.0 + (1.3 * log_mzb)
         y = 0.2 + (mean_zb / 200.0)
         r_bar = f / (
             1.0
-            + (
-                (x * math.log(1.0 + (y * (1.0 - math.pow(u0, -0.42)))))
-                / math.log(1.0 + y)
-            )
+            + ((x * math.log(1.0 + (y * (1.0 - u0**-0.42)))) / math.log(1.0 + y))
         )
         if f / r_bar < phi0:
             r_bar = f / phi0
         g = (
             0.22
-            * math.log(4.0 * mean_zb)
+            * (_LOG_4 + log_mzb)
             * (1.0 - (2.0 * math.exp((mean_zb * (1.0 - u0)) / 15.0)))
         )
         h = 1.0 - ((10.0 * (1.0 - (1.0 / (1.0 + (u0 / 10.0))))) / (mean_zb * mean_zb))
@@ -84,28 +94,33 @@ class XPP(PhiRhoZ):
 
     @property
     def mean_atomic_number(self) -> float:
+        return self._mean_atomic_number
+
+    def _za_from_chi(self, chi: np.ndarray) -> np.ndarray:
+        """Evaluates the absorbed-intensity expression for the given chi
+        values (cm^2/g); shared by the scalar and array entry points."""
         return (
-            sum(
-                [
-                    f * math.sqrt(e.atomic_number)
-                    for e, f in self.composition.weight_fractions.items()
-                ]
+            (self.phi0 + (self.big_b / (self.little_b + chi)))
+            - (
+                (self.big_a * self.little_a * self.eps)
+                / ((self.little_b * (1.0 + self.eps)) + chi)
             )
-            ** 2
-        )
+        ) / (self.little_b + chi)
 
     def compute_za_correction(self, xrt: XRayTransition) -> float:
         chi = FromSI.cm2pg(self.chi(xrt))
-        return ToSI.gpcm2(
-            (
-                (self.phi0 + (self.big_b / (self.little_b + chi)))
-                - (
-                    (self.big_a * self.little_a * self.eps)
-                    / ((self.little_b * (1.0 + self.eps)) + chi)
-                )
-            )
-            / (self.little_b + chi)
+        return float(ToSI.gpcm2(self._za_from_chi(np.asarray(chi))))
+
+    def compute_za_correction_array(self, energies: np.ndarray) -> np.ndarray:
+        """
+        Computes the ZA correction for an array of photon `energies` (J) in a
+        single vectorized pass.
+        """
+        chi = FromSI.cm2pg(
+            np.array([self._bound_mac(energy) for energy in energies])
+            * self._inv_sin_toa
         )
+        return ToSI.gpcm2(self._za_from_chi(chi))
 
     def generated(self, xrt: XRayTransition) -> float:
         return ToSI.gpcm2(self.f)
@@ -118,3 +133,16 @@ class XPP(PhiRhoZ):
             (((self.big_b * rho_z) + self.phi0) - self.big_a)
             * math.exp(-self.little_b * rho_z)
         )
+
+    def compute_curve_array(self, rho_z: np.ndarray) -> np.ndarray:
+        """Computes the phi-rho-z curve heights for an array of z positions."""
+        rz = FromSI.gpcm2(np.asarray(rho_z, dtype=float))
+        return np.where(
+            rho_z <= 0.0,
+            0.0,
+            (self.big_a * np.exp(-self.little_a * rz))
+            + (
+                (((self.big_b * rz) + self.phi0) - self.big_a)
+                * np.exp(-self.little_b * rz)
+            ),
+        )
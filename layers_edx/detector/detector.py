@@ -41,8 +41,28 @@ class XRayWindowLayer:
         )
         return result * ToSI.gpcm3(self.material.density) * ToSI.nm(self.thickness)
 
+    def mac_array(
+        self, energies: npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """
+        Calculates the mass absorption coefficient of the layer over an array
+        of energies.
+
+        Args:
+            energies (npt.NDArray[np.floating]): The energies of the x-ray
+                beam (J).
+
+        Returns:
+            npt.NDArray[np.floating]: The mass absorption coefficients of the
+            layer at the given energies (m²/kg).
+        """
+        result = MassAbsorptionCoefficient.compute_composition_array(
+            self.material.composition, energies
+        )
+        return result * ToSI.gpcm3(self.material.density) * ToSI.nm(self.thickness)
 
-@dataclass
+
+@dataclass(frozen=True)
 class XRayWindow:
     """
     Represents the window of an x-ray detector.
@@ -50,12 +70,16 @@ class XRayWindow:
     Attributes:
     - open_fraction (float): The fraction of the window that is not blocked.
     Default is 1.0.
-    - layers (list[XRayWindowLayer]): The layers of materials which are stacked
-    to form the x-ray window. Defaults to an empty list.
+    - layers (tuple[XRayWindowLayer, ...]): The layers of materials which are
+    stacked to form the x-ray window. Defaults to an empty tuple.
     """
 
     open_fraction: float = 1.0
-    layers: list[XRayWindowLayer] = field(default_factory=list)
+    layers: tuple[XRayWindowLayer, ...] = ()
+
+    def __post_init__(self):
+        # Accept any iterable of layers but store an immutable tuple.
+        object.__setattr__(self, "layers", tuple(self.layers))
 
     def mac(self, energy: float) -> float:
         """
@@ -71,6 +95,26 @@ class XRayWindow:
         """
         return sum([layer.mac(energy) for layer in self.layers])
 
+    def mac_array(
+        self, energies: npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """
+        Calculates the mass absorption coefficient of the x-ray window over an
+        array of energies.
+
+        Args:
+            energies (npt.NDArray[np.floating]): The energies of the x-ray
+                beam (J).
+
+        Returns:
+            npt.NDArray[np.floating]: The mass absorption coefficients of the
+            window at the given energies (m²/kg).
+        """
+        result = np.zeros(len(energies))
+        for layer in self.layers:
+            result += layer.mac_array(energies)
+        return result
+
     def transmission(self, energy: float) -> float:
         """
         Computes the fraction of the incident beam which is transmitted
@@ -84,6 +128,15 @@ class XRayWindow:
         """
         return self.open_fraction * math.exp(-self.mac(energy))
 
+    def transmission_array(
+        self, energies: npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """
+        Computes the transmitted fraction for an array of energies (J) in one
+        vectorized pass over the window layers.
+        """
+        return self.open_fraction * np.exp(-self.mac_array(energies))
+
     def absorption(self, energy: float) -> float:
         """
         Computes the fraction of the incident beam which is absorbed by the window.
@@ -105,8 +158,10 @@ class GridMountedWindow(XRayWindow):
         open_fraction: float = 1.0,
         layers: list[XRayWindowLayer] | None = None,
     ):
-        super().__init__(open_fraction, layers)
-        self._grid = XRayWindowLayer(grid_material, grid_thickness)
+        super().__init__(open_fraction, tuple(layers) if layers else ())
+        object.__setattr__(
+            self, "_grid", XRayWindowLayer(grid_material, grid_thickness)
+        )
 
     @property
     def grid(self) -> XRayWindowLayer:
@@ -119,6 +174,56 @@ class GridMountedWindow(XRayWindow):
         )
         return super().transmission(energy) / self.open_fraction * grid_transmission
 
+    def transmission_array(
+        self, energies: npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        grid_transmission = self.open_fraction + (1.0 - self.open_fraction) * np.exp(
+            -self.grid.mac_array(energies)
+        )
+        return (
+            super().transmission_array(energies)
+            / self.open_fraction
+            * grid_transmission
+        )
+
+
+# The absorber elements of the EDS detector stack and their mass thickness
+# per unit length, constructed once instead of per get_efficiency call.
+_SI, _AU, _AL, _NI = (Element(symbol) for symbol in ("Si", "Au", "Al", "Ni"))
+_SI_DENSITY = ToSI.gpcm3(Material(_SI).density)
+_AU_DENSITY = ToSI.gpcm3(Material(_AU).density)
+_AL_DENSITY = ToSI.gpcm3(Material(_AL).density)
+_NI_DENSITY = ToSI.gpcm3(Material(_NI).density)
+
+
+def _material_key(material: Material) -> tuple:
+    return (
+        tuple(
+            (element.atomic_number, fraction)
+            for element, fraction in material.composition.raw_weight_fractions.items()
+        ),
+        material.density,
+    )
+
+
+def _window_key(window: XRayWindow) -> tuple:
+    key: tuple = (
+        type(window).__name__,
+        window.open_fraction,
+        tuple(
+            (_material_key(layer.material), layer.thickness)
+            for layer in window.layers
+        ),
+    )
+    if isinstance(window, GridMountedWindow):
+        key += ((_material_key(window.grid.material), window.grid.thickness),)
+    return key
+
+
+# Efficiency grids keyed by the calibration and detector parameters they
+# depend on, shared across detector instances with the same configuration.
+_EFFICIENCY_CACHE: dict[tuple, npt.NDArray[np.floating]] = {}
+
 
 @dataclass(frozen=True)
 class DetectorProperties:
@@ -148,7 +253,7 @@ class DetectorProperties:
     gold_layer: float = 0.0
     aluminium_layer: float = 0.0
     nickel_layer: float = 0.0
-    window: XRayWindow = field(default_factory=XRayWindow)
+    window: XRayWindow = XRayWindow()
 
 
 @dataclass(frozen=True)
@@ -172,10 +277,11 @@ class DetectorPosition:
 
     @cached_property
     def orientation(self) -> npt.NDArray[np.floating]:
-        el = np.deg2rad(self.elevation)
-        az = np.deg2rad(self.azimuth)
+        el = math.radians(self.elevation)
+        az = math.radians(self.azimuth)
+        cos_el = math.cos(el)
         return np.array(
-            [-np.cos(el) * np.cos(az), -np.cos(el) * np.sin(az), np.sin(el)]
+            [-cos_el * math.cos(az), -cos_el * math.sin(az), math.sin(el)]
         )
 
     @cached_property
@@ -218,6 +324,9 @@ TDetectorCalibration = TypeVar("TDetectorCalibration", bound=DetectorCalibration
 class EDSCalibration(DetectorCalibration):
     MIN_OVERVOLTAGE = 1.1
     FIRST_ELEMENT = [Element("Ca"), Element("B"), Element("La"), Element("Am")]
+    # Atomic-number thresholds indexed by transition family, replacing the
+    # per-call scan of FIRST_ELEMENT in is_visible.
+    _FIRST_Z = tuple(element.atomic_number for element in FIRST_ELEMENT)
 
     def __init__(
         self,
@@ -249,48 +358,68 @@ class EDSCalibration(DetectorCalibration):
     ) -> npt.NDArray[np.floating]:
         """
         Computes the detector efficiency given the detector properties `properties`.
+        The result only depends on the calibration and detector parameters, so it
+        is cached across instances and returned as a read-only array.
         """
-
-        mac = MassAbsorptionCoefficient.compute
-
-        si, au, al, ni = [Element(element) for element in ["Si", "Au", "Al", "Ni"]]
-        active_mt = ToSI.gpcm3(Material(si).density) * ToSI.mm(properties.thickness)
-        dead_mt = ToSI.gpcm3(Material(si).density) * ToSI.um(properties.dead_layer)
-        au_mt = ToSI.gpcm3(Material(au).density) * ToSI.nm(properties.gold_layer)
-        al_mt = ToSI.gpcm3(Material(al).density) * ToSI.nm(properties.aluminium_layer)
-        ni_mt = ToSI.gpcm3(Material(ni).density) * ToSI.nm(properties.nickel_layer)
-
-        data = np.array(
-            [
-                ToSI.ev(self.channel_width * (i + 0.5) + self.zero_offset)
-                for i in range(properties.channel_count)
-            ]
+        key = (
+            self.channel_width,
+            self.zero_offset,
+            properties.channel_count,
+            properties.area,
+            properties.thickness,
+            properties.dead_layer,
+            properties.gold_layer,
+            properties.aluminium_layer,
+            properties.nickel_layer,
+            _window_key(properties.window),
+        )
+        efficiency = _EFFICIENCY_CACHE.get(key)
+        if efficiency is None:
+            efficiency = self._compute_efficiency(properties)
+            efficiency.setflags(write=False)
+            _EFFICIENCY_CACHE[key] = efficiency
+        return efficiency
+
+    def _compute_efficiency(
+        self, properties: DetectorProperties
+    ) -> npt.NDArray[np.floating]:
+        active_mt = _SI_DENSITY * ToSI.mm(properties.thickness)
+        dead_mt = _SI_DENSITY * ToSI.um(properties.dead_layer)
+        au_mt = _AU_DENSITY * ToSI.nm(properties.gold_layer)
+        al_mt = _AL_DENSITY * ToSI.nm(properties.aluminium_layer)
+        ni_mt = _NI_DENSITY * ToSI.nm(properties.nickel_layer)
+
+        data = ToSI.ev(
+            self.channel_width * (np.arange(properties.channel_count) + 0.5)
+            + self.zero_offset
         )
 
-        def func(e: float) -> float:
-            result = 1.0
-            result *= properties.window.transmission(e)
-            result *= 1 - math.exp(-mac(si, e) * active_mt)
-            result *= math.exp(-mac(si, e) * dead_mt)
-            result *= math.exp(-mac(au, e) * au_mt)
-            result *= math.exp(-mac(al, e) * al_mt)
-            result *= math.exp(-mac(ni, e) * ni_mt)
-            return result
-
-        return (
-            np.vectorize(func)(data)
-            * ToSI.mm2(properties.area)
-            * (1.0 / (4.0 * math.pi))
+        mac_si = MassAbsorptionCoefficient.compute_array(_SI, data)
+        mac_au = MassAbsorptionCoefficient.compute_array(_AU, data)
+        mac_al = MassAbsorptionCoefficient.compute_array(_AL, data)
+        mac_ni = MassAbsorptionCoefficient.compute_array(_NI, data)
+        efficiency = (
+            properties.window.transmission_array(data)
+            * (1.0 - np.exp(-mac_si * active_mt))
+            * np.exp(
+                -(
+                    mac_si * dead_mt
+                    + mac_au * au_mt
+                    + mac_al * al_mt
+                    + mac_ni * ni_mt
+                )
+            )
         )
+        return efficiency * ToSI.mm2(properties.area) * (1.0 / (4.0 * math.pi))
 
     def is_visible(self, xrt: XRayTransition, energy: float) -> bool:
         """Checks if the specified `xrt` is visible at this beam `energy`."""
         if xrt.edge_energy > (energy / self.MIN_OVERVOLTAGE):
             return False
-        for family, element in enumerate(self.FIRST_ELEMENT):
-            if xrt.family == family:
-                return xrt.element.atomic_number >= element.atomic_number
-        return False
+        family = xrt.family
+        if family >= len(self._FIRST_Z):
+            return False
+        return xrt.element.atomic_number >= self._FIRST_Z[family]
 
 
 class Detector(ABC):
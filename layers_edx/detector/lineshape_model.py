@@ -1,5 +1,8 @@
+import functools
 import math
 from abc import ABC, abstractmethod
+import numpy as np
+from numpy import typing as npt
 from layers_edx.element import Element
 from layers_edx.xrt import XRayTransition
 
@@ -36,9 +39,19 @@ def fwhm_to_gaussian_width(fwhm: float) -> float:
     return fwhm / 2.354820045030949382023138652918  # = 2*sqrt(-2.0*ln(0.5))
 
 
+@functools.lru_cache(maxsize=None)
+def half_width_factor(fraction: float) -> float:
+    """
+    The Gaussian half width, in units of sigma, at which the intensity has
+    fallen to `fraction` of its peak value. Cached since callers evaluate it
+    with a fixed fraction per spectrum.
+    """
+    return math.sqrt(-2.0 * math.log(fraction))
+
+
 def gaussian(delta: float, sigma: float) -> float:
     """Computes the Gaussian function (normalized to an integral of 1.0)"""
-    return math.exp(-0.5 * (delta - sigma) ** 2) / (sigma * SQRT_2PI)
+    return math.exp(-0.5 * (delta / sigma) ** 2) / (sigma * SQRT_2PI)
 
 
 class LineshapeModel(ABC):
@@ -62,6 +75,20 @@ class LineshapeModel(ABC):
         `center` (in eV). The integral over all energies is normalized to 1.0.
         """
 
+    def compute_array(
+        self, energies: npt.NDArray[np.floating], center: float
+    ) -> npt.NDArray[np.floating]:
+        """
+        Computes the intensities at an array of energies (in eV) for a peak at
+        `center` (in eV). Subclasses should override this with a vectorized
+        implementation; the fallback evaluates `compute` per energy.
+        """
+        return np.fromiter(
+            (self.compute(energy, center) for energy in energies),
+            float,
+            len(energies),
+        )
+
     @abstractmethod
     def left_width(self, energy: float, fraction: float) -> float:
         """
@@ -94,15 +121,32 @@ class FanoSiLiLineshape(LineshapeModel):
         else:
             self.fano = fano
             self.noise = noise
+        # The line-width formula only uses the squared noise, so square it
+        # once here instead of on every gaussian_line_width call.
+        self._noise_sq = self.noise**2
 
     def gaussian_line_width(self, energy: float) -> float:
-        return compute_resolution(self.fano, self.noise, energy)
+        return ENERGY_PER_EH_PAIR * math.sqrt(
+            self._noise_sq + (energy * self.fano) / ENERGY_PER_EH_PAIR
+        )
 
     def left_width(self, energy: float, fraction: float) -> float:
-        return self.gaussian_line_width(energy) * math.sqrt(-2.0 * math.log(fraction))
+        return self.gaussian_line_width(energy) * half_width_factor(fraction)
 
     def right_width(self, energy: float, fraction: float) -> float:
         return self.left_width(energy, fraction)
 
     def compute(self, energy: float, center: float) -> float:
         return gaussian(energy - center, self.gaussian_line_width(center))
+
+    def compute_array(
+        self, energies: npt.NDArray[np.floating], center: float
+    ) -> npt.NDArray[np.floating]:
+        """
+        Vectorized counterpart of `compute`. The line width (a sqrt) and the
+        normalization divide are evaluated once for the fixed `center` rather
+        than per energy.
+        """
+        sigma = self.gaussian_line_width(center)
+        inv_norm = 1.0 / (sigma * SQRT_2PI)
+        return np.exp(-0.5 * ((energies - center) / sigma) ** 2) * inv_norm
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from layers_edx import read_csv
 from layers_edx.units import ToSI
 
@@ -148,14 +150,35 @@ class Element:
         )
     ]
 
+    # Dense array form of the atomic weights for bulk indexing by atomic
+    # number in the composition math.
+    ATOMIC_WEIGHT_ARR = np.array(ATOMIC_WEIGHT)
+
+    # O(1) symbol lookup replacing the list.index scan on every construction.
+    _NAME_INDEX = {name: index for index, name in enumerate(NAME)}
+
+    # Elements are immutable, so repeated constructions of the same atomic
+    # number share one flyweight instance.
+    _INSTANCES: dict[int, Element] = {}
+
     @classmethod
     def from_name(cls, name: str) -> int:
-        return cls.NAME.index(name)
+        return cls._NAME_INDEX[name]
 
-    def __init__(self, element: int | str):
-        self._atomic_number = (
-            element if isinstance(element, int) else self.NAME.index(element)
+    def __new__(cls, element: int | str):
+        atomic_number = (
+            element if isinstance(element, int) else cls._NAME_INDEX[element]
         )
+        instance = cls._INSTANCES.get(atomic_number)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._atomic_number = atomic_number
+            cls._INSTANCES[atomic_number] = instance
+        return instance
+
+    def __init__(self, element: int | str):
+        # The atomic number is assigned in __new__; nothing to do here.
+        pass
 
     def __lt__(self, other: Element):
         return self.atomic_number < other.atomic_number
@@ -210,11 +233,10 @@ class Composition:
     ) -> list[float]:
         """Computes the atomic fractions from the provided `elements`
         and weight `fractions`."""
-        atomic_fractions = [
-            fraction / element.atomic_weight
-            for element, fraction in zip(elements, fractions)
+        atomic_fractions = np.asarray(fractions) / Element.ATOMIC_WEIGHT_ARR[
+            [element.atomic_number for element in elements]
         ]
-        return cls.normalize_fractions(atomic_fractions)
+        return (atomic_fractions / atomic_fractions.sum()).tolist()
 
     @classmethod
     def weight_from_atomic(
@@ -222,11 +244,10 @@ class Composition:
     ) -> list[float]:
         """Computes the weight fractions from the provided `elements`
         and atomic `fractions`."""
-        weight_fractions = [
-            fraction * element.atomic_weight
-            for element, fraction in zip(elements, fractions)
+        weight_fractions = np.asarray(fractions) * Element.ATOMIC_WEIGHT_ARR[
+            [element.atomic_number for element in elements]
         ]
-        return cls.normalize_fractions(weight_fractions)
+        return (weight_fractions / weight_fractions.sum()).tolist()
 
     def __init__(
         self,
@@ -240,9 +261,18 @@ class Composition:
             self._weight_fractions = fractions
         else:
             self._weight_fractions = self.weight_from_atomic(elements, fractions)
+        self._invalidate_fraction_caches()
         if normalize:
             self.normalize()
 
+    def _invalidate_fraction_caches(self):
+        """Drops the memoized fraction dictionaries after `_weight_fractions`
+        changed."""
+        self._weight_fractions_cache = None
+        self._atomic_fractions_cache = None
+        self._atoms_per_kg_cache = None
+        self._element_arrays_cache = None
+
     def copy(self) -> Composition:
         """Initializes a new object with shallow copies of the `elements`
         and `weight_fractions` lists."""
@@ -258,13 +288,16 @@ class Composition:
     @property
     def atomic_fractions(self) -> dict[Element, float]:
         """A dictionary mapping the elements to their atomic fractions
-        as defined in this composition. Normalized to sum 100%."""
-        return dict(
-            zip(
-                self.elements,
-                self.atomic_from_weight(self.elements, self._weight_fractions),
+        as defined in this composition. Normalized to sum 100%.
+        Memoized until the weight fractions change."""
+        if self._atomic_fractions_cache is None:
+            self._atomic_fractions_cache = dict(
+                zip(
+                    self.elements,
+                    self.atomic_from_weight(self.elements, self._weight_fractions),
+                )
             )
-        )
+        return self._atomic_fractions_cache
 
     @property
     def raw_weight_fractions(self) -> dict[Element, float]:
@@ -275,9 +308,25 @@ class Composition:
     @property
     def weight_fractions(self) -> dict[Element, float]:
         """A dictionary mapping the elements to their weight fractions
-        which are normalized to sum 100%."""
-        fractions = self.normalize_fractions(self._weight_fractions)
-        return dict(zip(self.elements, fractions))
+        which are normalized to sum 100%.
+        Memoized until the weight fractions change."""
+        if self._weight_fractions_cache is None:
+            fractions = self.normalize_fractions(self._weight_fractions)
+            self._weight_fractions_cache = dict(zip(self.elements, fractions))
+        return self._weight_fractions_cache
+
+    @property
+    def element_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Parallel arrays of the atomic numbers, atomic weights and raw
+        weight fractions of the elements, for vectorized reductions over the
+        composition. Memoized until the weight fractions change."""
+        if self._element_arrays_cache is None:
+            self._element_arrays_cache = (
+                np.array([e.atomic_number for e in self._elements], dtype=float),
+                np.array([e.atomic_weight for e in self._elements]),
+                np.array(self._weight_fractions, dtype=float),
+            )
+        return self._element_arrays_cache
 
     @property
     def sum_weight_fractions(self) -> float:
@@ -287,8 +336,12 @@ class Composition:
     @property
     def atoms_per_kg(self) -> dict[Element, float]:
         """Number of atoms of the elements in one kilogram of material
-        with this composition."""
-        return {e: f / e.mass for e, f in self.weight_fractions.items()}
+        with this composition. Memoized until the weight fractions change."""
+        if self._atoms_per_kg_cache is None:
+            self._atoms_per_kg_cache = {
+                e: f / e.mass for e, f in self.weight_fractions.items()
+            }
+        return self._atoms_per_kg_cache
 
     @property
     def mean_atomic_number(self) -> float:
@@ -297,23 +350,33 @@ class Composition:
     def normalize(self):
         """Normalizes the weight fractions."""
         self._weight_fractions = self.normalize_fractions(self._weight_fractions)
+        self._invalidate_fraction_caches()
 
     def weight_difference(
         self, other: Composition, normalized: bool = True
     ) -> dict[Element, float]:
         """Calculates the differences of two composition objects: self - other."""
-        differences: dict[Element, float] = {}
         self_fractions = (
             self.weight_fractions if normalized else self.raw_weight_fractions
         )
         other_fractions = (
             other.weight_fractions if normalized else other.raw_weight_fractions
         )
-        for e in self_fractions.keys() | other_fractions.keys():
-            self_f = self_fractions[e] if e in self_fractions else 0
-            other_f = other_fractions[e] if e in other_fractions else 0
-            differences[e] = self_f - other_f
-        return differences
+        # Scatter both compositions onto atomic-number indexed arrays and
+        # subtract in one go instead of per-element membership checks.
+        self_arr = np.zeros(len(Element.NAME))
+        other_arr = np.zeros(len(Element.NAME))
+        present = np.zeros(len(Element.NAME), dtype=bool)
+        for e, f in self_fractions.items():
+            self_arr[e.atomic_number] = f
+            present[e.atomic_number] = True
+        for e, f in other_fractions.items():
+            other_arr[e.atomic_number] = f
+            present[e.atomic_number] = True
+        differences = self_arr - other_arr
+        return {
+            Element(int(z)): float(differences[z]) for z in np.flatnonzero(present)
+        }
 
 
 class Material:
@@ -439,12 +502,16 @@ class Material:
         -1.0,
     ]
 
+    # Dense array form of the densities for bulk indexing by atomic number.
+    DENSITY_ARR = np.array(DENSITY)
+
     @classmethod
     def density_from_composition(cls, composition: Composition) -> float:
-        density = 0
-        for element, fraction in composition.weight_fractions.items():
-            density += fraction * cls.DENSITY[element.atomic_number]
-        return density
+        fractions = composition.weight_fractions
+        return float(
+            np.asarray(list(fractions.values()))
+            @ cls.DENSITY_ARR[[element.atomic_number for element in fractions]]
+        )
 
     def __init__(
         self, composition: Composition | Element, density: float | None = None
@@ -43,15 +43,19 @@ class CullByVariance(CullingStrategy):
     def compute(
         self, parameters: list[TParameter], fit_result: npt.NDArray[np.floating]
     ) -> set[Element]:
-        remove: set[Element] = set()
-        for element in set([p.element for p in parameters]):
-            kratios: list[float] = []
-            for i, p in enumerate(parameters):
-                if p.element == element:
-                    kratios.append(fit_result[i])
-            kratio_mean = np.mean(kratios)
-            if not np.isnan(kratio_mean) and kratio_mean < self.significance * np.var(
-                kratio_mean
-            ):
-                remove.add(element)
-        return remove
+        # Aggregate the k-ratios per element in one bincount pass instead of
+        # re-scanning the parameter list for every element.
+        element_ids = np.array([p.element.atomic_number for p in parameters])
+        fit_result = np.asarray(fit_result)
+        counts = np.bincount(element_ids)
+        safe_counts = np.maximum(counts, 1)
+        means = np.bincount(element_ids, weights=fit_result) / safe_counts
+        variances = (
+            np.bincount(element_ids, weights=fit_result**2) / safe_counts - means**2
+        )
+        remove_ids = np.nonzero(
+            (counts > 0)
+            & ~np.isnan(means)
+            & (means < self.significance * variances)
+        )[0]
+        return {Element(int(atomic_number)) for atomic_number in remove_ids}
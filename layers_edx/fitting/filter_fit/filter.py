@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-import copy
 import numpy.typing as npt
 import numpy as np
 
@@ -16,6 +15,7 @@ class Filter(ABC):
 
     def __init__(self, width: float, channel_width: float):
         self._filter = None
+        self._filter_sq = None
         self._variance_correction_factor = None
         self._width = width
         self._channel_width = channel_width
@@ -23,7 +23,13 @@ class Filter(ABC):
 
     @property
     def filter(self) -> npt.NDArray[np.floating] | None:
-        return copy.copy(self._filter)
+        """The filter coefficients as a read-only array; must not be mutated."""
+        return self._filter
+
+    @property
+    def filter_sq(self) -> npt.NDArray[np.floating] | None:
+        """The squared filter coefficients, precomputed for error propagation."""
+        return self._filter_sq
 
     @property
     def variance_correction_factor(self) -> float | None:
@@ -57,16 +63,14 @@ class TopHatFilter(Filter):
 
     def _initialize_filter(self):
         # (2*m+1)*self.channel_width ~ self.filter_width
-        m = max(int(round(self.width / self.channel_width)) - 1 // 2, 2)
+        m = max((int(round(self.width / self.channel_width)) - 1) // 2, 2)
         n = m
-        filter_len = (2 * n) + (2 * m) + 1
-        new_filter = [
-            -1.0 if i < n or i >= n + (2 * m) + 1 else 0 for i in range(filter_len)
-        ]
-        k = (2.0 * n) / ((2.0 * m) + 1.0)
-        for i in range((2 * m) + 1):
-            new_filter[i + n] = k
+        new_filter = np.full((2 * n) + (2 * m) + 1, -1.0)
+        new_filter[n : n + (2 * m) + 1] = (2.0 * n) / ((2.0 * m) + 1.0)
         self._filter = new_filter
+        self._filter.setflags(write=False)
+        self._filter_sq = self._filter**2
+        self._filter_sq.setflags(write=False)
         self._variance_correction_factor = self.default_variance_correction_factor(
             m, 2 * m + 1
         )
@@ -25,11 +25,18 @@ class FilterFit(LinearFit):
         Fills NaN values and values which are below the `thresh` with
         the previous value in the `data`.
         """
-        for idx in np.where(np.isnan(data) | (data < thresh))[0]:
-            if idx == 0:
-                data[idx] = 0.0 if thresh == float("inf") else float("inf")
-            else:
-                data[idx] = data[idx - 1]
+        mask = np.isnan(data) | (data < thresh)
+        if not mask.any():
+            return data
+        if mask[0]:
+            data[0] = 0.0 if thresh == float("inf") else float("inf")
+            mask[0] = False
+        # Forward-fill in C: map every masked position onto the index of the
+        # last preceding unmasked value via a running maximum.
+        idx = np.arange(len(data))
+        idx[mask] = 0
+        np.maximum.accumulate(idx, out=idx)
+        data[:] = data[idx]
         return data
 
     def __init__(
@@ -56,6 +63,12 @@ class FilterFit(LinearFit):
             self._parameters.append(
                 FilterParameter(filtered, self.naive, self.model_thresh)
             )
+        # All filtered reference spectra packed into one contiguous float32
+        # matrix, so the features matrix is gathered from rows of a single
+        # array instead of from per-parameter float64 arrays.
+        self._ref_matrix = np.array(
+            [p.filtered.data for p in self._parameters], dtype=np.float32
+        )
 
     def filter_reference(
         self, reference: BaseSpectrum, roi: RegionOfInterest, element: Element
@@ -86,7 +99,13 @@ class FilterFit(LinearFit):
     ) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
         unknown = FilteredSpectrum(unknown, self._const_ff)
         ivs = Interval.sortmerge([p.filtered.non_zero_interval for p in selected])
-        idx = Interval.extract(len(unknown.data), ivs)
-        features = np.vstack([self.fill_data(p.filtered.data[idx]) for p in selected]).T
+        idx = Interval.extract_indices(ivs)
+        # Fill the preallocated matrix column-by-column; Fortran order keeps
+        # the columns contiguous for LAPACK, avoiding the vstack-plus-
+        # transpose copies.
+        rows = [self.parameters.index(p) for p in selected]
+        features = np.empty((len(idx), len(selected)), dtype=np.float64, order="F")
+        for column, row in enumerate(rows):
+            features[:, column] = self.fill_data(self._ref_matrix[row, idx])
         targets = self.fill_data(unknown.data[idx]).reshape(-1, 1)
         return features, targets
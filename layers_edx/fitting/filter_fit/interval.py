@@ -27,14 +27,15 @@ class Interval:
         Inplace sorts the provided list of `intervals` and merges overlapping intervals.
         """
         intervals.sort(key=lambda x: x.lower)
-        i = 0
-        while i < len(intervals) - 1:
-            if cls.overlaps(intervals[i], intervals[i + 1]):
-                intervals[i] = cls.merge(intervals[i], intervals[i + 1])
-                intervals.pop(i + 1)
-                i = 0
+        # With the list sorted by lower, a single sweep comparing each interval
+        # against the last merged one suffices.
+        merged: list[Interval] = []
+        for interval in intervals:
+            if merged and cls.overlaps(merged[-1], interval):
+                merged[-1] = cls.merge(merged[-1], interval)
             else:
-                i += 1
+                merged.append(interval)
+        intervals[:] = merged
         return intervals
 
     @classmethod
@@ -48,6 +49,18 @@ class Interval:
             bool_arr[interval.lower : interval.upper] = True
         return bool_arr
 
+    @classmethod
+    def extract_indices(cls, intervals: list[Interval]) -> npt.NDArray[np.intp]:
+        """
+        Generates the array of indices covered by the sorted, disjoint
+        `intervals`; the gather-index counterpart of `extract`.
+        """
+        if not intervals:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(
+            [np.arange(interval.lower, interval.upper) for interval in intervals]
+        )
+
     def __init__(self, lower: int, upper: int):
         self.lower = lower
         self.upper = upper
@@ -57,6 +70,11 @@ class NonZeroInterval(Interval):
     """An interval containing all non-zero channels in the array `data`."""
 
     def __init__(self, data: npt.NDArray[np.floating]):
-        lower = int(np.argmax(data != 0))
-        upper = int(len(data) - 1 - np.argmax(data[::-1] != 0).item())
+        # One nonzero scan instead of two argmax passes (the reversed one
+        # walked a copy of the data).
+        non_zero = np.flatnonzero(data)
+        if non_zero.size == 0:
+            lower, upper = 0, len(data) - 1
+        else:
+            lower, upper = int(non_zero[0]), int(non_zero[-1])
         super().__init__(lower, upper)
@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from typing import TypeVar, Any
 import numpy as np
 import numpy.typing as npt
+from scipy.optimize import nnls
 from layers_edx.fitting.culling import TCullingStrategy
 from layers_edx.element import Element
 from layers_edx.fitting.parameter import TParameter
@@ -61,41 +62,40 @@ class LinearFit(ABC):
 
     def get_k_ratios(self, unknown: dict[XRayTransition, float]) -> KRatioSet:
         """Computes the k-ratios between the references and the provided data."""
-        zero_fit_params = np.zeros(self.num_fit_params, dtype=bool)
+        parameters = self.parameters
+        element_ids = np.array([p.element.atomic_number for p in parameters])
+        active = np.ones(self.num_fit_params, dtype=bool)
+        removed_by_z = np.zeros(len(Element.NAME), dtype=bool)
         remove, removed = set(), set()
-        for p in self.parameters:
+        for p in parameters:
             p.kratio = 0.0
         repeat = True
         while repeat:
-            repeat = False
-            selected = []
+            # Newly culled elements flip their bit in the atomic-number
+            # lookup, which masks the affected parameters in one gather.
+            for element in remove:
+                removed_by_z[element.atomic_number] = True
             removed.update(remove)
             remove.clear()
-            for i, p in enumerate(self.parameters):
-                if p.element in removed:
-                    zero_fit_params[i] = True
-                if not zero_fit_params[i]:
-                    selected.append(p)
+            active &= ~removed_by_z[element_ids]
+            selected_idx = np.flatnonzero(active)
+            selected = [parameters[i] for i in selected_idx]
             features, targets = self.features_and_targets(unknown, selected)
-            fit = np.linalg.lstsq(features, targets, rcond=1.0e-12)
+            # Non-negative least squares enforces kratio >= 0 in a single
+            # solve, replacing the clamp-negatives-and-refit retry loop.
+            fit, _ = nnls(features, targets.ravel())
             fit_params = np.zeros(self.num_fit_params)
-            fit_params[~zero_fit_params] = fit[0].flatten()
-            for i, p in enumerate(self.parameters):
-                if not zero_fit_params[i]:
-                    p.kratio = fit_params[i]
-                    if p.kratio < 0.0:
-                        p.kratio = 0.0
-                        zero_fit_params[i] = True
-                        repeat = True
+            fit_params[selected_idx] = fit
+            for p, kratio in zip(selected, fit):
+                p.kratio = kratio
             if self.culling_strategy is not None:
-                cull_these = self.culling_strategy.compute(self.parameters, fit_params)
-                remove.update(cull_these)
-            for p in self.parameters:
-                if p.element in remove | removed:
+                remove.update(self.culling_strategy.compute(parameters, fit_params))
+            for p in selected:
+                if p.element in remove:
                     p.kratio = 0.0
-            repeat = repeat or len(remove - removed) > 0
+            repeat = len(remove - removed) > 0
         result = KRatioSet()
-        for p in self.parameters:
+        for p in parameters:
             result.add(p.xrt_set, p.kratio)
         return result
 
@@ -5,6 +5,9 @@ from layers_edx.element import Element
 class KRatioSet:
     def __init__(self):
         self._data: dict[XRayTransitionSet, float] = {}
+        # Secondary index mapping each member transition to the stored sets
+        # containing it, so lookups scan a small bucket instead of all sets.
+        self._by_xrt: dict[XRayTransition, list[XRayTransitionSet]] = {}
 
     @property
     def xrt_sets(self) -> list[XRayTransitionSet]:
@@ -21,7 +24,13 @@ class KRatioSet:
     @property
     def kratio_sum(self) -> float:
         """The sum of non-negative k-ratios."""
-        return sum([kratio for kratio in self.kratios if kratio > 0.0])
+        # Accumulate directly over the dict values; the filtered-list
+        # comprehension allocated garbage on every call.
+        total = 0.0
+        for kratio in self._data.values():
+            if kratio > 0.0:
+                total += kratio
+        return total
 
     @property
     def elements(self) -> set[Element]:
@@ -33,6 +42,9 @@ class KRatioSet:
         Adds the `kratio` to the data dictionary. Overwrites an existing value
         if the `xrt_set` is already in the data dictionary.
         """
+        if xrt_set not in self._data:
+            for xrt in xrt_set.xrts:
+                self._by_xrt.setdefault(xrt, []).append(xrt_set)
         self._data[xrt_set] = kratio
 
     def remove(self, xrt_set: XRayTransitionSet):
@@ -41,6 +53,12 @@ class KRatioSet:
         """
         if xrt_set in self.xrt_sets:
             del self._data[xrt_set]
+            for xrt in xrt_set.xrts:
+                bucket = self._by_xrt.get(xrt)
+                if bucket is not None:
+                    bucket.remove(xrt_set)
+                    if not bucket:
+                        del self._by_xrt[xrt]
 
     def find(self, xrt_set: XRayTransitionSet) -> float | None:
         """
@@ -51,13 +69,11 @@ class KRatioSet:
             return self._data[xrt_set]
         score = 0.0
         kratio = None
-        xrt = xrt_set.weightiest_transition
-        for data_xrt_set, data_kratio in self._data.items():
-            if xrt in data_xrt_set.xrts:
-                similarity = xrt_set.similarity(data_xrt_set)
-                if similarity > 0.8 and similarity > score:
-                    score = similarity
-                    kratio = data_kratio
+        for data_xrt_set in self._by_xrt.get(xrt_set.weightiest_transition, ()):
+            similarity = xrt_set.similarity(data_xrt_set)
+            if similarity > 0.8 and similarity > score:
+                score = similarity
+                kratio = self._data[data_xrt_set]
         return kratio
 
     def kratio_from_xrt_set_raw(self, xrt_set: XRayTransitionSet) -> float:
@@ -75,7 +91,6 @@ class KRatioSet:
         Returns the k-ratio value associated with an `XRayTransitionSet`
         which contains the `xrt`.
         """
-        for xrt_set in self.xrt_sets:
-            if xrt in xrt_set.xrts:
-                return self.kratio_from_xrt_set(xrt_set)
+        for xrt_set in self._by_xrt.get(xrt, ()):
+            return self.kratio_from_xrt_set(xrt_set)
         return 0.0
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import math
-import scipy
 from typing import Type
+import numpy as np
 from layers_edx.atomic_shell import AtomicShell
 from layers_edx.correction import NoCorrection, PhiRhoZ
 from layers_edx.correction.pap import PAP
@@ -10,22 +10,63 @@ from layers_edx.simulation import BasicSimulator
 from layers_edx.spectrum.spectrum_properties import SpectrumProperties
 from layers_edx.xrt import XRayTransition
 
+# Fixed-order Gauss-Legendre rule for the emitted-intensity integral; the
+# integrand is smooth, so 24 nodes match adaptive quadrature to full
+# precision while evaluating the curve in one vectorized call.
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(24)
+
 
 def corrected_intensities(
     layers: list[Layer], xrts: set[XRayTransition] | None = None
 ) -> dict[XRayTransition, float]:
     intensities: dict[XRayTransition, float] = {}
-    for layer in layers:
+    mass_thicknesses = np.array([layer.mass_thickness for layer in layers])
+    # Group the contributions by element and transition (XRayTransition
+    # equality ignores the element, so the dict key alone is not enough) so
+    # the layer-chi vector is built once per line instead of per layer.
+    groups: dict[tuple[int, int | None], list[tuple[int, Layer, float]]] = {}
+    representatives: dict[tuple[int, int | None], XRayTransition] = {}
+    for i, layer in enumerate(layers):
         for xrt, ideal_intensity in layer.ideal_intensities.items():
             if xrts is not None and xrt not in xrts:
                 continue
-            result = intensities[xrt] if xrt in intensities else 0.0
-            result += (
-                ideal_intensity
-                * layer.upper_layer_absorption(xrt, layers)
-                * layer.emitted_intensity(xrt, layers)
-            )
-            intensities[xrt] = result
+            key = (xrt.element.atomic_number, xrt.transition)
+            groups.setdefault(key, []).append((i, layer, ideal_intensity))
+            representatives.setdefault(key, xrt)
+    # One batched quadrature per layer covers all the lines it emits; the
+    # curve evaluation is shared between lines with the same destination
+    # shell.
+    layer_keys: dict[int, list[tuple[int, int | None]]] = {}
+    for key, members in groups.items():
+        for i, _, _ in members:
+            layer_keys.setdefault(i, []).append(key)
+    emitted: dict[tuple[int, tuple[int, int | None]], float] = {}
+    for i, keys in layer_keys.items():
+        values = layers[i].emitted_intensities(
+            [representatives[key] for key in keys], layers
+        )
+        for key, value in zip(keys, values):
+            emitted[(i, key)] = value
+    for key, members in groups.items():
+        xrt = representatives[key]
+        chi = np.array(
+            [layer.algorithm(xrt.destination).chi(xrt) for layer in layers]
+        )
+        # upper_layer_absorption for layer i sums mt_j*(chi_i - chi_j) over
+        # the covering layers j in 1..i-1; prefix sums turn that into one
+        # vectorized exponent per layer instead of a nested loop.
+        covered_mt = np.concatenate(
+            ([0.0, 0.0], np.cumsum(mass_thicknesses[1:])[:-1])
+        )[: len(layers)]
+        covered_chi_mt = np.concatenate(
+            ([0.0, 0.0], np.cumsum((chi * mass_thicknesses)[1:])[:-1])
+        )[: len(layers)]
+        absorption = np.exp(chi * covered_mt - covered_chi_mt)
+        total = sum(
+            ideal_intensity * absorption[i] * emitted[(i, key)]
+            for i, _, ideal_intensity in members
+        )
+        intensities[xrt] = intensities.get(xrt, 0.0) + total
     return intensities
 
 
@@ -71,7 +112,13 @@ class Layer:
         self._mass_thickness = new
 
     def rho_z(self, layers: list[Layer]) -> float:
-        return sum([layer.mass_thickness for layer in layers[: layers.index(self)]])
+        # Single pass instead of an index scan followed by a slice and sum.
+        total = 0.0
+        for layer in layers:
+            if layer is self:
+                break
+            total += layer.mass_thickness
+        return total
 
     def algorithm(self, shell: AtomicShell) -> PhiRhoZ:
         if shell not in self._algorithms:
@@ -92,13 +139,17 @@ class Layer:
 
     def upper_layer_absorption(self, xrt: XRayTransition, layers: list[Layer]) -> float:
         """Calculates the absorption of the layer's radiation by the layers above it."""
-        result = 1.0
-        for layer in layers[1 : layers.index(self)]:
-            delta_chi = self.algorithm(xrt.destination).chi(xrt) - layer.algorithm(
-                xrt.destination
-            ).chi(xrt)
-            result *= math.exp(layer.mass_thickness * delta_chi)
-        return result
+        self_chi = self.algorithm(xrt.destination).chi(xrt)
+        exponent = 0.0
+        for i, layer in enumerate(layers):
+            if layer is self:
+                break
+            if i == 0:
+                continue
+            exponent += layer.mass_thickness * (
+                self_chi - layer.algorithm(xrt.destination).chi(xrt)
+            )
+        return math.exp(exponent)
 
     def intensity_distribution(self, xrt: XRayTransition, rho_z: float) -> float:
         """The right part under the integral of equation (6) in PouchouPichoir1993."""
@@ -112,6 +163,40 @@ class Layer:
         """
         top = self.rho_z(layers)
         bottom = top + self.mass_thickness
-        return scipy.integrate.quad(
-            lambda x: self.intensity_distribution(xrt, x), top, bottom
-        )[0]
+        algorithm = self.algorithm(xrt.destination)
+        chi = algorithm.chi(xrt)
+        half = 0.5 * (bottom - top)
+        rho_z = 0.5 * (top + bottom) + half * _GL_NODES
+        values = algorithm.compute_curve_array(rho_z) * np.exp(-chi * rho_z)
+        return half * float(_GL_WEIGHTS @ values)
+
+    def emitted_intensities(
+        self, xrts: list[XRayTransition], layers: list[Layer]
+    ) -> list[float]:
+        """
+        Batch variant of `emitted_intensity`: the phi-rho-z curve depends on
+        the destination shell only, so lines sharing a shell reuse one curve
+        evaluation at the quadrature nodes.
+        """
+        top = self.rho_z(layers)
+        bottom = top + self.mass_thickness
+        half = 0.5 * (bottom - top)
+        rho_z = 0.5 * (top + bottom) + half * _GL_NODES
+        shell_groups: dict[tuple[int, int], list[int]] = {}
+        for i, xrt in enumerate(xrts):
+            shell = xrt.destination
+            shell_groups.setdefault(
+                (shell.element.atomic_number, shell.shell), []
+            ).append(i)
+        results = [0.0] * len(xrts)
+        for indices in shell_groups.values():
+            curve = self.algorithm(xrts[indices[0]].destination).compute_curve_array(
+                rho_z
+            )
+            chi = np.array(
+                [self.algorithm(xrts[i].destination).chi(xrts[i]) for i in indices]
+            )
+            values = (curve * np.exp(-np.outer(chi, rho_z))) @ _GL_WEIGHTS
+            for i, value in zip(indices, values):
+                results[i] = half * float(value)
+        return results
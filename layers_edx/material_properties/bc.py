@@ -1,5 +1,6 @@
 import math
 from typing import Protocol
+import numpy as np
 from layers_edx.element import Composition
 
 
@@ -36,27 +37,23 @@ class BackscatterCoefficient:
     class PouchouAndPichoir1991(Algorithm):
         @classmethod
         def compute(cls, composition: Composition, energy: float) -> float:
-            total = (
-                composition.sum_weight_fractions
-                if composition.sum_weight_fractions < 1.1
-                else 1.1
-            )
-            zb = sum(
-                [
-                    f / total * math.sqrt(e.atomic_number)
-                    for e, f in composition.raw_weight_fractions.items()
-                ]
-            )
+            atomic_numbers, _, raw_fractions = composition.element_arrays
+            total = min(raw_fractions.sum(), 1.1)
+            zb = float((raw_fractions / total) @ np.sqrt(atomic_numbers))
             zb *= zb
             return (1.75e-3 * zb) + (
                 0.37 * (1.0 - math.exp(-0.015 * math.pow(zb, 1.3)))
             )
 
+    # Keyed by the structural content of the composition; the Pouchou and
+    # Pichoir coefficient does not depend on the incident energy.
+    _ETA_CACHE: dict[tuple, float] = {}
+
     @classmethod
     def compute(cls, composition: Composition, energy: float) -> float:
         """
         Computes the backscatter coefficient for the given composition and incident
-        energy.
+        energy. Memoized per composition.
 
         Currently uses the Pouchou and Pichoir (1991) model.
 
@@ -67,4 +64,10 @@ class BackscatterCoefficient:
         Returns:
             float: The computed backscatter coefficient (dimensionless).
         """
-        return cls.PouchouAndPichoir1991.compute(composition, energy)
+        atomic_numbers, _, raw_fractions = composition.element_arrays
+        key = (tuple(atomic_numbers), tuple(raw_fractions))
+        eta = cls._ETA_CACHE.get(key)
+        if eta is None:
+            eta = cls.PouchouAndPichoir1991.compute(composition, energy)
+            cls._ETA_CACHE[key] = eta
+        return eta
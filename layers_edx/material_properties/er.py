@@ -1,4 +1,4 @@
-import numpy as np
+import math
 from typing import Protocol
 from layers_edx.material_properties.mip import MeanIonizationPotential
 from layers_edx.atomic_shell import AtomicShell
@@ -43,22 +43,23 @@ class ElectronRange:
     class PouchouAndPichoir1991(Algorithm):
         @classmethod
         def compute(cls, composition: Composition, energy: float) -> float:
-            big_m = sum(
-                [
-                    f * e.atomic_number / e.atomic_weight
-                    for e, f in composition.weight_fractions.items()
-                ]
+            atomic_numbers, atomic_weights, raw_fractions = composition.element_arrays
+            big_m = float(
+                (raw_fractions / raw_fractions.sum())
+                @ (atomic_numbers / atomic_weights)
             )
             j = FromSI.kev(cls.mip.compute_composition(composition))
-            d = np.array([6.6e-6, 1.12e-5 * (1.35 - (0.45 * j * j)), 2.2e-6 / j])
-            p = np.array([0.78, 0.1, -(0.5 - 0.25 * j)])
+            kev_e = FromSI.kev(energy)
+            # Three explicit terms; the NumPy-array formulation paid two
+            # allocations and broadcast dispatch for three scalars.
+            d0, d1, d2 = 6.6e-6, 1.12e-5 * (1.35 - (0.45 * j * j)), 2.2e-6 / j
+            p0, p1, p2 = 0.78, 0.1, -(0.5 - (0.25 * j))
             tmp = (
-                np.power(j, 1.0 - p)
-                * d
-                * np.power(FromSI.kev(energy), 1.0 + p)
-                / (1.0 + p)
+                (d0 * math.pow(j, 1.0 - p0) * math.pow(kev_e, 1.0 + p0) / (1.0 + p0))
+                + (d1 * math.pow(j, 1.0 - p1) * math.pow(kev_e, 1.0 + p1) / (1.0 + p1))
+                + (d2 * math.pow(j, 1.0 - p2) * math.pow(kev_e, 1.0 + p2) / (1.0 + p2))
             )
-            return ToSI.gpcm2(tmp.sum() / big_m)
+            return ToSI.gpcm2(tmp / big_m)
 
     @classmethod
     def compute(
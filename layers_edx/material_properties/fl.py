@@ -1,6 +1,7 @@
 from __future__ import annotations
 import math
 from typing import Protocol
+import numpy as np
 from layers_edx.material_properties.fym import FluorescenceYieldMean
 from layers_edx.material_properties.idr import IonizationDepthRatio
 from layers_edx.material_properties.jr import JumpRatio
@@ -11,6 +12,37 @@ from layers_edx.element import Composition, Element
 from layers_edx.units import FromSI
 from layers_edx.xrt import XRayTransition, NAME
 
+# Parallel per-transition arrays (exists, energy, edge energy, family, weight,
+# family weight), built lazily once per element so the transition scans below
+# run as NumPy reductions instead of constructing XRayTransition objects.
+_XRT_TABLES: dict[int, tuple[np.ndarray, ...]] = {}
+
+
+def _xrt_table(element: Element) -> tuple[np.ndarray, ...]:
+    table = _XRT_TABLES.get(element.atomic_number)
+    if table is None:
+        count = len(NAME)
+        exists = np.zeros(count, dtype=bool)
+        energy = np.zeros(count)
+        edge_energy = np.zeros(count)
+        family = np.full(count, -1)
+        weight = np.zeros(count)
+        family_weight = np.zeros(count)
+        for transition in range(count):
+            xrt = XRayTransition(element, transition)
+            if xrt.exists:
+                exists[transition] = True
+                energy[transition] = xrt.energy
+                edge_energy[transition] = xrt.edge_energy
+                family[transition] = xrt.family
+                weight[transition] = xrt.weight()
+                family_weight[transition] = xrt.weight("family")
+        table = (exists, energy, edge_energy, family, weight, family_weight)
+        for arr in table:
+            arr.setflags(write=False)
+        _XRT_TABLES[element.atomic_number] = table
+    return table
+
 
 class Fluorescence:
     """
@@ -22,13 +54,18 @@ class Fluorescence:
     emission.
     """
 
+    # Results depend only on the exciting element and the target shell, so
+    # they are memoized under a structural key (AtomicShell instances are
+    # recreated per transition and hash by identity).
+    _PRIMARY_LINE_CACHE: dict[tuple[int, int, int], XRayTransition | None] = {}
+
     @classmethod
     def primary_exciting_line(
         cls, element: Element, shell: AtomicShell
     ) -> XRayTransition | None:
         """
         Determines the most effective X-ray transition in an element that can excite the
-        given atomic shell.
+        given atomic shell. Memoized per element and shell.
 
         Args:
             element (Element): The element from which the primary X-ray emission
@@ -39,19 +76,21 @@ class Fluorescence:
             (XRayTransition | None): The most suitable exciting X-ray transition, or
                 None if no valid transition is found.
         """
-        edge_energy = shell.edge_energy
-        best_transition = None
-        best_weight = 0.0
-        best_family = -1
-        for transition in range(len(NAME)):
-            xrt = XRayTransition(element, transition)
-            if xrt.exists and xrt.energy > edge_energy and xrt.family >= best_family:
-                weight = xrt.weight()
-                if xrt.family > best_family or weight > best_weight:
-                    best_transition = xrt
-                    best_weight = weight
-                    best_family = xrt.family
-        return best_transition
+        key = (element.atomic_number, shell.element.atomic_number, shell.shell)
+        if key in cls._PRIMARY_LINE_CACHE:
+            return cls._PRIMARY_LINE_CACHE[key]
+        exists, energy, _, family, weight, _ = _xrt_table(element)
+        candidates = exists & (energy > shell.edge_energy)
+        if not candidates.any():
+            result = None
+        else:
+            # The scan picked the weightiest line of the highest exciting
+            # family.
+            in_family = candidates & (family == family[candidates].max())
+            transition = int(np.argmax(np.where(in_family, weight, -1.0)))
+            result = XRayTransition(element, transition)
+        cls._PRIMARY_LINE_CACHE[key] = result
+        return result
 
     class Algorithm(Protocol):
         """
@@ -130,17 +169,21 @@ class Fluorescence:
             fluor_p = cls.fym.compute(primary.destination)
             a_p = primary.element.atomic_weight
             a_s = secondary.element.atomic_weight
-            u = FromSI.cm2pg(
-                cls.mac.compute_composition(composition, secondary.energy)
-            ) / (math.sin(take_off_angle) * mac_p)
-            v = cls.lc.compute(beam_energy, secondary) / mac_p
+            # Divide by mac_p once; u and v then come from multiplications.
+            inv_mac_p = 1.0 / mac_p
+            u = (
+                FromSI.cm2pg(cls.mac.compute_composition(composition, secondary.energy))
+                * inv_mac_p
+                / math.sin(take_off_angle)
+            )
+            v = cls.lc.compute(beam_energy, secondary) * inv_mac_p
             ss = cls.idr.compute(primary, secondary, beam_energy)
             f = cls.family_factor(secondary.family, primary.family)
             return (
                 f
                 * 0.5
                 * c_p
-                * (mac_ps / mac_p)
+                * (mac_ps * inv_mac_p)
                 * ionize_f
                 * fluor_p
                 * (a_s / a_p)
@@ -176,26 +219,29 @@ class Fluorescence:
                 value of 1.0 indicates no fluorescence enhancement.
         """
         total = 0.0
+        # The secondary line does not change inside the loop; bind its
+        # properties to locals once.
+        secondary_shell = secondary.destination
+        secondary_ee = secondary.edge_energy
+        max_primary_ee = secondary_ee + (5.0 if secondary.family == 0 else 3.5)
         for element in composition.elements:
-            primary = cls.primary_exciting_line(element, secondary.destination)
-            if primary is None or primary.edge_energy >= beam_energy:
+            primary = cls.primary_exciting_line(element, secondary_shell)
+            if primary is None:
                 continue
             primary_ee = primary.edge_energy
-            secondary_ee = secondary.edge_energy
-            delta = 5.0 if secondary.family == 0 else 3.5
-            if primary_ee >= (secondary_ee + delta):
+            if primary_ee >= beam_energy or primary_ee >= max_primary_ee:
                 continue
-            primary_family = primary.family
-            weight = 0.0
-            for transition in range(len(NAME)):
-                xrt = XRayTransition(element, transition)
-                if (
-                    xrt.exists
-                    and xrt.family == primary_family
-                    and xrt.energy >= secondary_ee
-                    and xrt.edge_energy < beam_energy
-                ):
-                    weight += xrt.weight("family")
+            exists, energy, edge_energy, family, _, family_weight = _xrt_table(
+                element
+            )
+            weight = float(
+                family_weight[
+                    exists
+                    & (family == primary.family)
+                    & (energy >= secondary_ee)
+                    & (edge_energy < beam_energy)
+                ].sum()
+            )
             if weight > 0.0:
                 total += (
                     cls.Reed1993.compute(
@@ -37,7 +37,7 @@ class FluorescenceYieldMean:
         @classmethod
         def compute(cls, shell: AtomicShell) -> float:
             return (
-                cls.DATA[shell.element.atomic_number][shell.family]
+                cls.DATA[shell.element.atomic_number, shell.family]
                 if shell.family <= 2
                 else 0.0
             )
@@ -1,9 +1,25 @@
 import math
 from abc import ABC, abstractmethod
+import numpy as np
 from layers_edx import read_csv
 from layers_edx.atomic_shell import AtomicShell
+from layers_edx.element import Element
 from layers_edx.units import FromSI, PhysicalConstants, ToSI
 
+# SI divisions hoisted into reciprocal multiplies for the per-call kernels.
+_J_TO_KEV = FromSI.kev(1.0)
+_J_TO_EV = FromSI.ev(1.0)
+
+# capacity / (2 * n^2) per shell index; with K as family 0 the principal
+# factor n reduces to family + 1.
+_SHELL_DEPENDENCE = AtomicShell.CAPACITY / (
+    2.0
+    * np.square(
+        [AtomicShell.family_from_name(name) + 1 for name in AtomicShell.NAME]
+    )
+)
+_SHELL_DEPENDENCE.setflags(write=False)
+
 
 class IonizationCrossSection(ABC):
     """
@@ -25,8 +41,7 @@ class IonizationCrossSection(ABC):
         Returns:
             float: Dimensionless weighting factor.
         """
-        n = shell.family - shell.family_from_name("K") + 1
-        return shell.capacity / (2.0 * n * n)
+        return float(_SHELL_DEPENDENCE[shell.shell])
 
     @classmethod
     @abstractmethod
@@ -71,8 +86,8 @@ class ProportionalIonizationCrossSection(IonizationCrossSection):
             Returns:
                 float: Unscaled cross-section (m^2).
             """
-            e_crit = FromSI.kev(shell.edge_energy)
-            u = FromSI.kev(beam_energy) / e_crit
+            e_crit = shell.edge_energy * _J_TO_KEV
+            u = (beam_energy * _J_TO_KEV) / e_crit
             if u <= 1.0:
                 return 0.0
             return math.log(u) / (
@@ -94,17 +109,23 @@ class ProportionalIonizationCrossSection(IonizationCrossSection):
             pass
 
     class Pouchou1986(Algorithm):
+        # The exponent depends only on (family, Z); precompute the dense
+        # table so the hot path is one lookup. Families beyond M stay NaN
+        # like the fall-through branch did.
+        _EXPONENT = np.full(
+            (len(AtomicShell.FAMILY), len(Element.NAME)), float("nan")
+        )
+        _EXPONENT[AtomicShell.family_from_name("K")] = [
+            0.86 + (0.12 * math.exp((-z * z) / 25.0))
+            for z in range(len(Element.NAME))
+        ]
+        _EXPONENT[AtomicShell.family_from_name("L")] = 0.82
+        _EXPONENT[AtomicShell.family_from_name("M")] = 0.78
+        _EXPONENT.setflags(write=False)
+
         @classmethod
         def compute_exponent(cls, shell: AtomicShell) -> float:
-            za = shell.element.atomic_number
-            if shell.family == shell.family_from_name("K"):
-                return 0.86 + (0.12 * math.exp((-za * za) / 25.0))
-            elif shell.family == shell.family_from_name("L"):
-                return 0.82
-            elif shell.family == shell.family_from_name("M"):
-                return 0.78
-            else:
-                return float("nan")
+            return float(cls._EXPONENT[shell.family, shell.element.atomic_number])
 
     @classmethod
     def compute_shell(cls, shell: AtomicShell, beam_energy: float) -> float:
@@ -170,68 +191,66 @@ class AbsoluteIonizationCrossSection(IonizationCrossSection):
     class BoteSalvat2008(Algorithm):
         FPIAB2 = 4.0 * math.pi * FromSI.cm(PhysicalConstants.BohrRadius) ** 2
         REV = FromSI.ev(PhysicalConstants.ElectronRestMass)
-
-        A = [
-            [line[i : i + 5] for i in range(0, len(line), 5)]
-            for line in read_csv("SalvatXionA", value_offset=1, column_offset=1)
-        ]
-
-        BE: list[list[float]] = []
-        ANLJ: list[list[float]] = []
-        G: list[list[list[float]]] = []
-        for data in [
-            [line[i : i + 6] for i in range(0, len(line), 6)]
-            for line in read_csv("SalvatXionB", value_offset=1, column_offset=1)
-        ]:
-            be = [block[0] for block in data]
-            anlj = [block[1] for block in data]
-            g = [block[2:] for block in data]
-            BE.append(be)
-            ANLJ.append(anlj)
-            G.append(g)
+        # Constant prefactor of the returned cross-section (m^2).
+        PREFACTOR = ToSI.cm(1) ** 2 * FPIAB2
+
+        # Contiguous (Z, shell, coefficient) views of the fit tables; the
+        # loader pads short rows with zeros, and zero coefficient blocks
+        # evaluate to a zero cross-section like the out-of-range guard.
+        _A_RAW = read_csv("SalvatXionA", value_offset=1, column_offset=1)
+        A = np.ascontiguousarray(_A_RAW.reshape(len(_A_RAW), -1, 5))
+        _B_RAW = read_csv("SalvatXionB", value_offset=1, column_offset=1)
+        _B = np.ascontiguousarray(_B_RAW.reshape(len(_B_RAW), -1, 6))
+        BE = _B[:, :, 0]
+        ANLJ = _B[:, :, 1]
+        G = np.ascontiguousarray(_B[:, :, 2:])
 
         @classmethod
         def compute_shell(cls, shell: AtomicShell, beam_energy: float) -> float:
-            eev = FromSI.ev(beam_energy)
-            uev = FromSI.ev(shell.edge_energy)
+            eev = beam_energy * _J_TO_EV
+            uev = shell.edge_energy * _J_TO_EV
             if 1e-35 > uev > eev:
                 return 0.0
             over_v = eev / uev
             iz = shell.element.atomic_number
             ish = shell.shell
             if over_v <= 16.0:
-                if ish >= len(cls.A[iz]):
+                if ish >= cls.A.shape[1]:
                     return 0.0
-                a = cls.A[iz][ish]
+                a = cls.A[iz, ish]
                 opu = 1.0 / (1.0 + over_v)
                 opu2 = opu**2
                 ffitlo = (
                     a[0] + a[1] * over_v + opu * (a[2] + opu2 * (a[3] + opu2 * a[4]))
                 )
-                xione = (over_v - 1.0) * math.pow(ffitlo / over_v, 2.0)
+                ratio = ffitlo / over_v
+                xione = (over_v - 1.0) * ratio * ratio
             else:
-                if ish >= len(cls.BE[iz]):
+                if ish >= cls.BE.shape[1]:
                     return 0.0
-                beta2 = (eev * (eev + (2.0 * cls.REV))) / (
-                    (eev + cls.REV) * (eev + cls.REV)
-                )
-                x = math.sqrt(eev * (eev + (2.0 * cls.REV))) / cls.REV
-                g = cls.G[iz][ish]
+                # Bind the rest energy locally and share the recurring
+                # subexpressions; the straight-line form keeps the kernel to
+                # one sqrt, one log and one pow.
+                rev = cls.REV
+                e_plus_rev = eev + rev
+                s = eev * (eev + (2.0 * rev))
+                beta2 = s / (e_plus_rev * e_plus_rev)
+                x = math.sqrt(s) / rev
+                g = cls.G[iz, ish]
                 ffitup = (
                     (((2.0 * math.log(x)) - beta2) * (1.0 + (g[0] / x)))
                     + g[1]
                     + (
                         g[2]
-                        * math.pow(
-                            (cls.REV * cls.REV) / ((eev + cls.REV) * (eev + cls.REV)),
-                            0.25,
+                        * math.sqrt(
+                            math.sqrt((rev * rev) / (e_plus_rev * e_plus_rev))
                         )
                     )
                     + (g[3] / x)
                 )
-                factor = cls.ANLJ[iz][ish] / beta2
-                xione = ((factor * over_v) / (over_v + cls.BE[iz][ish])) * ffitup
-            return ToSI.cm(1) ** 2 * cls.FPIAB2 * xione
+                factor = cls.ANLJ[iz, ish] / beta2
+                xione = ((factor * over_v) / (over_v + cls.BE[iz, ish])) * ffitup
+            return cls.PREFACTOR * xione
 
     @classmethod
     def compute_shell(cls, shell: AtomicShell, beam_energy: float) -> float:
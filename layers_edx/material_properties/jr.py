@@ -40,11 +40,15 @@ class JumpRatio:
                 shell.element, edge_energy + cls.DELTA
             ) / cls.mac.compute(shell.element, edge_energy - cls.DELTA)
 
+    # The ratio depends only on the element and shell index; AtomicShell
+    # instances are recreated per transition, so the key is structural.
+    _CACHE: dict[tuple[int, int], float] = {}
+
     @classmethod
     def compute(cls, shell: AtomicShell) -> float:
         """
         Computes the jump ratio for a given atomic shell using the default algorithm
-        (Heinrich 1986).
+        (Heinrich 1986). Memoized per element and shell.
 
         Args:
             shell (AtomicShell): The atomic shell of interest.
@@ -52,7 +56,12 @@ class JumpRatio:
         Returns:
             float: The computed jump ratio (dimensionless).
         """
-        return cls.Heinrich1986.compute(shell)
+        key = (shell.element.atomic_number, shell.shell)
+        ratio = cls._CACHE.get(key)
+        if ratio is None:
+            ratio = cls.Heinrich1986.compute(shell)
+            cls._CACHE[key] = ratio
+        return ratio
 
     @classmethod
     def ionization_fraction(cls, shell: AtomicShell) -> float:
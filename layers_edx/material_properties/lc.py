@@ -1,8 +1,26 @@
 import math
 from typing import Protocol
+import numpy as np
+from numpy import typing as npt
 from layers_edx.units import FromSI
 from layers_edx.xrt import XRayTransition
 
+# SI division hoisted into a reciprocal multiply for the per-call kernel.
+_J_TO_KEV = FromSI.kev(1.0)
+
+# kev(edge_energy)**1.65 per line, shared by the scalar and array paths
+# (XRayTransition equality ignores the element, so the key is structural).
+_EDGE_TERMS: dict[tuple[int, int | None], float] = {}
+
+
+def _edge_term(xrt: XRayTransition) -> float:
+    key = (xrt.element.atomic_number, xrt.transition)
+    term = _EDGE_TERMS.get(key)
+    if term is None:
+        term = math.pow(FromSI.kev(xrt.edge_energy), 1.65)
+        _EDGE_TERMS[key] = term
+    return term
+
 
 class LeonardCoefficient:
     """
@@ -38,8 +56,16 @@ class LeonardCoefficient:
         @classmethod
         def compute(cls, beam_energy: float, xrt: XRayTransition) -> float:
             return 4.5e5 / (
-                math.pow(FromSI.kev(beam_energy), 1.65)
-                - math.pow(FromSI.kev(xrt.edge_energy), 1.65)
+                math.pow(beam_energy * _J_TO_KEV, 1.65) - _edge_term(xrt)
+            )
+
+        @classmethod
+        def compute_array(
+            cls, beam_energies: npt.NDArray[np.floating], xrt: XRayTransition
+        ) -> npt.NDArray[np.floating]:
+            return 4.5e5 / (
+                np.power(np.asarray(beam_energies, dtype=float) * _J_TO_KEV, 1.65)
+                - _edge_term(xrt)
             )
 
     @classmethod
@@ -56,3 +82,21 @@ class LeonardCoefficient:
             float: The Leonard coefficient (dimensionless).
         """
         return cls.Heinrich1967.compute(beam_energy, xrt)
+
+    @classmethod
+    def compute_array(
+        cls, beam_energies: npt.NDArray[np.floating], xrt: XRayTransition
+    ) -> npt.NDArray[np.floating]:
+        """
+        Computes the Leonard coefficient over an array of beam energies.
+
+        Args:
+            beam_energies (npt.NDArray[np.floating]): The primary beam
+                energies (J).
+            xrt (XRayTransition): The X-ray transition for which the coefficient
+                is calculated.
+
+        Returns:
+            npt.NDArray[np.floating]: The Leonard coefficients (dimensionless).
+        """
+        return cls.Heinrich1967.compute_array(beam_energies, xrt)
@@ -1,5 +1,6 @@
 import math
 from typing import Protocol
+import numpy as np
 from layers_edx import read_csv
 from layers_edx.element import Element, Composition
 from layers_edx.units import ToSI
@@ -68,10 +69,28 @@ class MeanIonizationPotential:
                 return value
         return float("nan")
 
+    # Log of the elemental potentials, built once on first use; the compound
+    # formula only ever needs the logarithm.
+    _LOG_MIP = None
+
+    # Keyed by the structural content of the composition.
+    _COMPOSITION_CACHE: dict[tuple, float] = {}
+
+    @classmethod
+    def _log_mip(cls) -> np.ndarray:
+        if cls._LOG_MIP is None:
+            values = np.full(len(Element.NAME), float("nan"))
+            for z in range(1, len(Element.NAME)):
+                values[z] = math.log(cls.compute(Element(z)))
+            values.setflags(write=False)
+            cls._LOG_MIP = values
+        return cls._LOG_MIP
+
     @classmethod
     def compute_composition(cls, composition: Composition) -> float:
         """
         Computes the effective mean ionization potential for a compound or mixture.
+        Memoized per composition.
 
         Args:
             composition (Composition): The composition containing weight fractions of
@@ -80,14 +99,14 @@ class MeanIonizationPotential:
         Returns:
             float: The effective mean ionization potential (J).
         """
-        m = 0.0
-        ln_j = 0.0
-        for element in composition.elements:
-            cz_a = (
-                composition.weight_fractions[element]
-                * element.atomic_number
-                / element.atomic_weight
-            )
-            m += cz_a
-            ln_j += cz_a * math.log(cls.compute(element))
-        return math.exp(ln_j / m)
+        atomic_numbers, atomic_weights, raw_fractions = composition.element_arrays
+        key = (tuple(atomic_numbers), tuple(raw_fractions))
+        value = cls._COMPOSITION_CACHE.get(key)
+        if value is None:
+            # The normalization of the fractions cancels in exp(ln_j / m), so
+            # the raw fractions can be used directly.
+            cz_a = raw_fractions * atomic_numbers / atomic_weights
+            log_mip = cls._log_mip()[atomic_numbers.astype(np.intp)]
+            value = math.exp(float(cz_a @ log_mip) / float(cz_a.sum()))
+            cls._COMPOSITION_CACHE[key] = value
+        return value
@@ -1,5 +1,7 @@
 import math
 from typing import Protocol
+import numpy as np
+from numpy import typing as npt
 from layers_edx.material_properties.bc import BackscatterCoefficient
 from layers_edx.atomic_shell import AtomicShell
 from layers_edx.element import Composition
@@ -48,6 +50,18 @@ class SurfaceIonization:
             r = 2.0 - (2.3 * eta)
             return 1.0 + (3.3 * (1.0 - (1.0 / math.pow(u0, r))) * math.pow(eta, 1.2))
 
+        @classmethod
+        def compute_array(
+            cls, composition: Composition, shells: list[AtomicShell], energy: float
+        ) -> npt.NDArray[np.floating]:
+            # eta, r and eta**1.2 are invariant over the shells; evaluate
+            # them once and vectorize the overvoltage term.
+            eta = cls.bc.compute(composition, energy)
+            r = 2.0 - (2.3 * eta)
+            eta12 = math.pow(eta, 1.2)
+            u0 = energy / np.array([shell.edge_energy for shell in shells])
+            return 1.0 + (3.3 * (1.0 - np.power(u0, -r)) * eta12)
+
     @classmethod
     def compute(
         cls, composition: Composition, shell: AtomicShell, energy: float
@@ -65,3 +79,22 @@ class SurfaceIonization:
             float: The surface ionization factor (dimensionless).
         """
         return cls.Pouchou1991.compute(composition, shell, energy)
+
+    @classmethod
+    def compute_array(
+        cls, composition: Composition, shells: list[AtomicShell], energy: float
+    ) -> npt.NDArray[np.floating]:
+        """
+        Computes the surface ionization correction factor for several shells at
+        once, amortizing the composition-dependent terms across the shells.
+
+        Args:
+            composition (Composition): The sample composition.
+            shells (list[AtomicShell]): The atomic shells of interest.
+            energy (float): The excitation energy (J).
+
+        Returns:
+            npt.NDArray[np.floating]: The surface ionization
+            factors (dimensionless).
+        """
+        return cls.Pouchou1991.compute_array(composition, shells, energy)
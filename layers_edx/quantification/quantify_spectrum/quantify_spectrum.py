@@ -31,6 +31,7 @@ class QuantifySpectrum(QuantifyUsingStandards):
     ):
         super().__init__(beam_energy, standards, user_references, culling_strategy)
         self._detector = detector
+        self._linear_fit = None
 
     @staticmethod
     def create_reference(standard: StandardSpectrum) -> ReferenceSpectrum:
@@ -46,9 +47,13 @@ class QuantifySpectrum(QuantifyUsingStandards):
 
     @property
     def linear_fit(self) -> FilterFit:
-        return FilterFit(
-            self.references, self.detector, self.culling_strategy, naive=False
-        )
+        """The filter fit over the assigned references. Built lazily and
+        reused across unknowns, so the references are filtered only once."""
+        if self._linear_fit is None:
+            self._linear_fit = FilterFit(
+                self.references, self.detector, self.culling_strategy, naive=False
+            )
+        return self._linear_fit
 
     def compute(self, unknown: BaseSpectrum) -> KRatioSet:
         return super().compute(self.pre_process_spectrum(unknown))
@@ -136,6 +136,12 @@ class BaseSpectrum:
         """
         return int((energy - self.zero_offset) / self.channel_width)
 
+    def channels_from_energies(
+        self, energies: npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.integer]:
+        """Vectorized counterpart of `channel_from_energy`."""
+        return ((energies - self.zero_offset) / self.channel_width).astype(int)
+
     def min_energy_from_channel(self, channel: int) -> float:
         """Returns the energy on the lower side of the `channel` bin in eV."""
         return self.zero_offset + (channel * self.channel_width)
@@ -147,6 +153,12 @@ class BaseSpectrum:
     def average_energy_from_channel(self, channel: int) -> float:
         return self.zero_offset + (channel + 0.5) * self.channel_width
 
+    def average_energy_from_channels(
+        self, channels: npt.NDArray[np.integer]
+    ) -> npt.NDArray[np.floating]:
+        """Vectorized counterpart of `average_energy_from_channel`."""
+        return self.zero_offset + (channels + 0.5) * self.channel_width
+
     def estimate_background(
         self, mode: str, start: int, min_bins: int = 5, max_bins: int = 50
     ) -> tuple[float, float, int]:
@@ -277,7 +277,9 @@ def family_from_transition(transition: int) -> int:
     return AtomicShell.family_from_name(dest_name)
 
 
-def weight_normalization(weights_list: llf) -> tuple[llf, llf, llf]:
+def weight_normalization(
+    weights_list: llf,
+) -> tuple[list[list[float]], list[list[float]], list[list[float]]]:
     dest_len = AtomicShell.from_name("NV") - AtomicShell.from_name("K") + 1
     dest_norm = [[0.0] * dest_len for _ in range(len(weights_list))]
     fam_len = AtomicShell.family_from_name("N") - AtomicShell.family_from_name("K") + 1